@@ -1,7 +1,12 @@
 # config.py
 import os
+import sys
 from dotenv import load_dotenv
 import json
+import functools
+import pickle
+import tempfile
+from types import MappingProxyType
 
 load_dotenv()
 
@@ -64,35 +69,28 @@ class SnowflakeConfig:
     pass
 
 
+# Per-environment Snowflake variables, read as SNOWFLAKE_<ENV>_<KEY>
+SNOWFLAKE_CREDENTIAL_KEYS = ("USER", "PASSWORD", "ACCOUNT", "WAREHOUSE", "DATABASE", "SCHEMA", "ROLE")
+
 # NEW: Function to dynamically load Snowflake credentials for a specific environment
 def load_snowflake_env_credentials(env_name):
     env_prefix = f"SNOWFLAKE_{env_name.upper()}_" # e.g., SNOWFLAKE_PREPOD_USER
-    
-    user = os.getenv(f"{env_prefix}USER")
-    password = os.getenv(f"{env_prefix}PASSWORD")
-    account = os.getenv(f"{env_prefix}ACCOUNT")
-    warehouse = os.getenv(f"{env_prefix}WAREHOUSE")
-    database = os.getenv(f"{env_prefix}DATABASE")
-    schema = os.getenv(f"{env_prefix}SCHEMA")
-    role = os.getenv(f"{env_prefix}ROLE")
-
-    if not all([user, password, account, warehouse, database, schema, role]):
+
+    # Read each variable exactly once; the missing-vars report reuses these values
+    credentials = {
+        key.lower(): os.getenv(f"{env_prefix}{key}")
+        for key in SNOWFLAKE_CREDENTIAL_KEYS
+    }
+
+    missing_vars = [f"{env_prefix}{key}" for key in SNOWFLAKE_CREDENTIAL_KEYS if not credentials[key.lower()]]
+    if missing_vars:
         # Raise error but provide useful info
-        missing_vars = [f"{env_prefix}{v}" for v in ["USER", "PASSWORD", "ACCOUNT", "WAREHOUSE", "DATABASE", "SCHEMA", "ROLE"] if not os.getenv(f"{env_prefix}{v}")]
         raise ValueError(
             f"Missing Snowflake credentials for environment '{env_name}'. "
             f"Ensure all of {', '.join(missing_vars)} are set in .env"
         )
     
-    return {
-        "user": user,
-        "password": password,
-        "account": account,
-        "warehouse": warehouse,
-        "database": database,
-        "schema": schema,
-        "role": role
-    }
+    return credentials
 
 
 class FilePaths:
@@ -102,6 +100,10 @@ class FilePaths:
     DB_FILE = "confluence_metadata.db"
     # MODIFIED: Single resolver file, not environment-specific in its name
     SOURCE_FQDN_RESOLVER_FILE = "source_to_fqdn_resolver.json"
+    # NEW: Suffix for the pickled snapshot of the resolved FQDN map (written next to the resolver JSON)
+    RESOLVER_CACHE_SUFFIX = ".cache.pkl"
+    # NEW: Bumped whenever the resolved map's layout changes, so older snapshots are rebuilt
+    RESOLVER_CACHE_FORMAT_VERSION = 1
     SNOWFLAKE_ML_SOURCE_TABLE = "snowflake_ml_source_metadata"
     
     # NEW: Report output directory, same as TABLES_DIR for simplicity
@@ -118,19 +120,96 @@ def get_confluence_page_titles(json_file_path="titles.json"):
     """
     Reads a list of Confluence page titles from a JSON file.
     """
-    if not os.path.exists(json_file_path):
+    # stat doubles as the existence check (and supplies the memoization key)
+    try:
+        titles_stat = os.stat(json_file_path)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Titles JSON file not found at: {json_file_path}")
+    # The memoized list is shared, so hand each caller its own copy
+    return list(_load_confluence_page_titles_cached(
+        os.path.abspath(json_file_path), titles_stat.st_mtime_ns, titles_stat.st_size
+    ))
+
+@functools.lru_cache(maxsize=4)
+def _load_confluence_page_titles_cached(json_file_path, source_mtime_ns, source_size):
+    """
+    Parses the titles JSON file. Memoized on (path, mtime_ns, size).
+    """
     try:
         with open(json_file_path, 'r', encoding='utf-8') as f:
             titles = json.load(f)
             if not isinstance(titles, list):
                 raise ValueError("Titles JSON file must contain a list of strings.")
             return titles
+    except FileNotFoundError:
+        # Removed between the caller's stat and this open
+        raise FileNotFoundError(f"Titles JSON file not found at: {json_file_path}")
     except json.JSONDecodeError as e:
         raise ValueError(f"Error decoding titles JSON file: {e}")
     except Exception as e:
         raise Exception(f"An unexpected error occurred reading titles file: {e}")
 
+def _read_resolver_cache(cache_path, source_mtime_ns, source_size):
+    """
+    Returns the resolved FQDN map from the pickled snapshot, or None if the snapshot
+    is missing, was not built from the current JSON source (format version, mtime_ns
+    and size must all match), or cannot be read.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            snapshot = pickle.load(f)
+        if not isinstance(snapshot, tuple) or len(snapshot) != 4:
+            return None
+        format_version, cached_mtime_ns, cached_size, resolved_fqdn_map = snapshot
+        if (format_version, cached_mtime_ns, cached_size) != (
+            FilePaths.RESOLVER_CACHE_FORMAT_VERSION, source_mtime_ns, source_size
+        ):
+            return None
+        return resolved_fqdn_map
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"WARNING: Could not read resolver cache '{cache_path}': {e}. Rebuilding from JSON.")
+        return None
+
+def _write_resolver_cache(cache_path, resolved_fqdn_map, source_mtime_ns, source_size):
+    """
+    Atomically writes the resolved FQDN map as a pickled snapshot, stored together with
+    the format version and the mtime_ns/size of the JSON source it was built from.
+    Failures only cost the next cold start.
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    snapshot = (FilePaths.RESOLVER_CACHE_FORMAT_VERSION, source_mtime_ns, source_size, resolved_fqdn_map)
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"WARNING: Could not write resolver cache '{cache_path}': {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _freeze_resolved_fqdn_map(resolved_fqdn_map):
+    """
+    Wraps every level of the resolved FQDN map in a read-only MappingProxyType.
+    Detail dicts shared between environments, and env maps shared between a canonical
+    key and its aliases, keep sharing a single proxy.
+    """
+    frozen_by_id = {} # id(original dict) -> its proxy (the originals stay alive for the whole call)
+    def _freeze(mapping, freeze_values):
+        frozen = frozen_by_id.get(id(mapping))
+        if frozen is None:
+            if freeze_values:
+                frozen = MappingProxyType({key: _freeze(value, False) for key, value in mapping.items()})
+            else:
+                frozen = MappingProxyType(mapping)
+            frozen_by_id[id(mapping)] = frozen
+        return frozen
+
+    return MappingProxyType({
+        source_name: _freeze(env_fqdns, True) for source_name, env_fqdns in resolved_fqdn_map.items()
+    })
+
 # MODIFIED: load_fqdn_resolver to parse the new group/fallback structure
 def load_fqdn_resolver(json_file_path=None):
     """
@@ -146,38 +225,68 @@ def load_fqdn_resolver(json_file_path=None):
             }
         }
     Raises ValueError on duplicates, missing keys, or malformed FQDNs.
+    A successfully resolved map is snapshotted to '<json_file_path>.cache.pkl' and reused
+    by later calls (and processes) while the JSON file's mtime and size (and the snapshot
+    format version) still match. Within a process the
+    map is memoized and returned read-only at every level (the outer map, each env map and
+    each detail mapping are MappingProxyType views) and shared by all callers.
     """
     if json_file_path is None:
         json_file_path = FilePaths.SOURCE_FQDN_RESOLVER_FILE
 
-    if not os.path.exists(json_file_path):
+    # stat doubles as the existence check (and supplies the memoization key)
+    try:
+        source_stat = os.stat(json_file_path)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Source FQDN resolver file not found at: {json_file_path}. "
                                 f"Ensure '{json_file_path}' exists.")
+    return _load_fqdn_resolver_cached(
+        os.path.abspath(json_file_path), source_stat.st_mtime_ns, source_stat.st_size
+    )
+
+@functools.lru_cache(maxsize=4)
+def _load_fqdn_resolver_cached(json_file_path, source_mtime_ns, source_size):
+    """
+    Builds (or loads from the pickled snapshot) the read-only resolved FQDN map for one
+    version of the resolver JSON. Memoized on (path, mtime_ns, size), so an edited file is re-read.
+    """
+    # Reuse the pickled snapshot when it was built from this exact version of the JSON source
+    cache_path = json_file_path + FilePaths.RESOLVER_CACHE_SUFFIX
+    cached_map = _read_resolver_cache(cache_path, source_mtime_ns, source_size)
+    if cached_map is not None:
+        return _freeze_resolved_fqdn_map(cached_map)
     
     try:
-        def _raise_on_duplicate_keys(ordered_pairs):
-            d = {}
-            for k, v in ordered_pairs:
-                if k in d:
-                    raise ValueError(f"Duplicate key '{k}' found in '{json_file_path}' (case-sensitive). Please ensure all keys within the JSON file itself are unique.")
-                d[k] = v
-            return d
+        # The hook runs bottom-up for every JSON object, so the document root is always the
+        # last call. Nested objects are built with plain dict(); only the root's pairs are kept
+        # and iterated below, so duplicate canonical keys are caught while the map is built.
+        last_object_pairs = [None]
+        def _remember_object_pairs(ordered_pairs):
+            last_object_pairs[0] = ordered_pairs
+            return dict(ordered_pairs)
 
         with open(json_file_path, 'r', encoding='utf-8') as f:
-            raw_resolver_map = json.load(f, object_pairs_hook=_raise_on_duplicate_keys)
+            raw_resolver_map = json.load(f, object_pairs_hook=_remember_object_pairs)
             
             if not isinstance(raw_resolver_map, dict):
                 raise ValueError("Source FQDN resolver file must contain a dictionary of canonical entries.")
-            
+
             resolved_fqdn_map = {} 
+            seen_canonical_keys = set()
             
-            for canonical_key_raw, details in raw_resolver_map.items():
+            # Walk the root pairs once: exact duplicate detection and map building share the loop
+            for canonical_key_raw, details in last_object_pairs[0]:
+                if canonical_key_raw in seen_canonical_keys:
+                    raise ValueError(f"Duplicate key '{canonical_key_raw}' found in '{json_file_path}' (case-sensitive). Please ensure all keys within the JSON file itself are unique.")
+                seen_canonical_keys.add(canonical_key_raw)
+
                 if not isinstance(details, dict):
                     raise ValueError(f"Entry for '{canonical_key_raw}' in {json_file_path} is malformed. Expected a dictionary value.")
 
-                canonical_key_upper = canonical_key_raw.upper()
+                canonical_key_upper = sys.intern(canonical_key_raw.upper())
 
-                # Build the environment-specific FQDNs for this canonical key
+                # Build the environment-specific FQDNs for this canonical key. Keys, FQDNs and object
+                # types are interned so repeated values (and the pickled snapshot) share one string.
                 current_canonical_env_fqdns = {} # {ENV_UPPER: {"fqdn": FQDN_UPPER, "object_type": OBJECT_TYPE_UPPER}}
 
                 # --- Process defaults first ---
@@ -191,17 +300,20 @@ def load_fqdn_resolver(json_file_path=None):
                         raise ValueError(f"'defaults.environments' for '{canonical_key_raw}' must be a list.")
 
                     default_fqdn_raw = defaults_detail['fqdn']
-                    default_fqdn_upper = default_fqdn_raw.upper()
-                    default_object_type = defaults_detail.get('object_type', 'TABLE').upper()
+                    default_fqdn_upper = sys.intern(default_fqdn_raw.upper())
+                    default_object_type = sys.intern(defaults_detail.get('object_type', 'TABLE').upper())
 
-                    if len(default_fqdn_upper.split('.')) != 3:
+                    if default_fqdn_upper.count('.') != 2:
                         raise ValueError(f"Default FQDN '{default_fqdn_raw}' for '{canonical_key_raw}' is not in DATABASE.SCHEMA.TABLE format.")
                     
-                    for env_name_raw in default_envs:
-                        current_canonical_env_fqdns[env_name_raw.upper()] = {
-                            "fqdn": default_fqdn_upper, 
-                            "object_type": default_object_type
-                        }
+                    # All default environments share one read-only detail dict
+                    shared_default_details = {
+                        "fqdn": default_fqdn_upper,
+                        "object_type": default_object_type
+                    }
+                    current_canonical_env_fqdns.update(
+                        dict.fromkeys((sys.intern(env_name_raw.upper()) for env_name_raw in default_envs), shared_default_details)
+                    )
                 
                 # --- Process specific_environments (overrides defaults) ---
                 specific_environments_detail = details.get('specific_environments')
@@ -214,13 +326,13 @@ def load_fqdn_resolver(json_file_path=None):
                              raise ValueError(f"Entry for specific environment '{env_raw}' under '{canonical_key_raw}' is malformed. Expected 'fqdn' key.")
                         
                         env_fqdn_raw = env_details['fqdn']
-                        env_fqdn_upper = env_fqdn_raw.upper()
-                        env_object_type = env_details.get('object_type', 'TABLE').upper()
+                        env_fqdn_upper = sys.intern(env_fqdn_raw.upper())
+                        env_object_type = sys.intern(env_details.get('object_type', 'TABLE').upper())
 
-                        if len(env_fqdn_upper.split('.')) != 3:
+                        if env_fqdn_upper.count('.') != 2:
                              raise ValueError(f"FQDN '{env_fqdn_raw}' for specific environment '{env_raw}' under '{canonical_key_raw}' is not in DATABASE.SCHEMA.TABLE format.")
                         
-                        current_canonical_env_fqdns[env_raw.upper()] = { # This overwrites defaults
+                        current_canonical_env_fqdns[sys.intern(env_raw.upper())] = { # This overwrites defaults
                             "fqdn": env_fqdn_upper, 
                             "object_type": env_object_type
                         }
@@ -243,7 +355,7 @@ def load_fqdn_resolver(json_file_path=None):
                 for alias_raw in aliases:
                     if not isinstance(alias_raw, str):
                          raise ValueError(f"Alias '{alias_raw}' for '{canonical_key_raw}' in {json_file_path} is not a string.")
-                    alias_upper = alias_raw.upper()
+                    alias_upper = sys.intern(alias_raw.upper())
                     
                     if alias_upper in resolved_fqdn_map:
                         if resolved_fqdn_map[alias_upper] != current_canonical_env_fqdns:
@@ -254,7 +366,12 @@ def load_fqdn_resolver(json_file_path=None):
                             )
                     resolved_fqdn_map[alias_upper] = current_canonical_env_fqdns
 
-            return resolved_fqdn_map
+            _write_resolver_cache(cache_path, resolved_fqdn_map, source_mtime_ns, source_size)
+            return _freeze_resolved_fqdn_map(resolved_fqdn_map)
+    except FileNotFoundError:
+        # Removed between the caller's stat and this open
+        raise FileNotFoundError(f"Source FQDN resolver file not found at: {json_file_path}. "
+                                f"Ensure '{json_file_path}' exists.")
     except json.JSONDecodeError as e:
         raise ValueError(f"Error decoding Source FQDN resolver file: {e}")
     except ValueError as e:
@@ -267,8 +384,6 @@ def load_column_mapper_config(json_file_path=FilePaths.COLUMN_MAPPER_CONFIG_FILE
     """
     Loads column mapper configuration from a JSON file.
     """
-    if not os.path.exists(json_file_path):
-        raise FileNotFoundError(f"Column mapper config file not found at: {json_file_path}")
     try:
         with open(json_file_path, 'r', encoding='utf-8') as f:
             config = json.load(f)
@@ -287,6 +402,9 @@ def load_column_mapper_config(json_file_path=FilePaths.COLUMN_MAPPER_CONFIG_FILE
             config['match_threshold'] = max(0, min(100, config['match_threshold']))
             
             return config
+    except FileNotFoundError:
+        # open() is the existence check; re-raise with the loader's own message
+        raise FileNotFoundError(f"Column mapper config file not found at: {json_file_path}")
     except json.JSONDecodeError as e:
         raise ValueError(f"Error decoding Column Mapper config file: {e}")
     except ValueError as e:
@@ -300,8 +418,6 @@ def load_data_type_map(json_file_path=FilePaths.DATA_TYPE_MAP_FILE):
     Loads the Confluence data type to Snowflake data type mapping from a JSON file.
     All keys (Confluence types) are converted to uppercase for case-insensitive matching.
     """
-    if not os.path.exists(json_file_path):
-        raise FileNotFoundError(f"Data type map file not found at: {json_file_path}")
     try:
         def _raise_on_duplicate_keys(ordered_pairs):
             d = {}
@@ -325,6 +441,9 @@ def load_data_type_map(json_file_path=FilePaths.DATA_TYPE_MAP_FILE):
                 if not isinstance(sf_type, str) or not sf_type.strip():
                     raise ValueError(f"Snowflake type for Confluence type '{conf_type}' is invalid: '{sf_type}'. Must be a non-empty string.")
             return data_type_map
+    except FileNotFoundError:
+        # open() is the existence check; re-raise with the loader's own message
+        raise FileNotFoundError(f"Data type map file not found at: {json_file_path}")
     except json.JSONDecodeError as e:
         raise ValueError(f"Error decoding Data Type map file: {e}")
     except ValueError as e:
@@ -341,222 +460,119 @@ def load_data_type_map(json_file_path=FilePaths.DATA_TYPE_MAP_FILE):
 if __name__ == "__main__":
     print("--- Testing load_fqdn_resolver and load_data_type_map functions ---")
 
-    # Test Case 1: Valid resolver map with defaults and specific overrides
-    print("\n=== Test Case 1: Valid map with defaults and specific overrides ===")
-    test_valid_json_path = "test_valid_fqdn_resolver.json"
-    valid_map_content = {
-      "PORTDB.PORTFOLIO_OPS_CANONICAL": {
-        "aliases": ["PORTDB.PORTFOLIO_OPS", "PORTFOLIO_OPS_ALT"],
-        "defaults": {
-          "environments": ["DEV", "QA"],
-          "fqdn": "RAW_DB.CORE.PORTFOLIO_OPS_COMMON",
-          "object_type": "TABLE"
-        },
-        "specific_environments": {
-          "PROD": {
-            "fqdn": "PROD_RAW_DB.PROD_CORE.PORTFOLIO_OPS_PROD",
-            "object_type": "TABLE"
+    # All self-test files live in one temporary directory (removed in one go on exit),
+    # and each path is passed to load_fqdn_resolver directly instead of patching FilePaths.
+    with tempfile.TemporaryDirectory() as test_dir:
+
+        # Test Case 1: Valid resolver map with defaults and specific overrides
+        print("\n=== Test Case 1: Valid map with defaults and specific overrides ===")
+        valid_map_content = {
+          "PORTDB.PORTFOLIO_OPS_CANONICAL": {
+            "aliases": ["PORTDB.PORTFOLIO_OPS", "PORTFOLIO_OPS_ALT"],
+            "defaults": {
+              "environments": ["DEV", "QA"],
+              "fqdn": "RAW_DB.CORE.PORTFOLIO_OPS_COMMON",
+              "object_type": "TABLE"
+            },
+            "specific_environments": {
+              "PROD": {
+                "fqdn": "PROD_RAW_DB.PROD_CORE.PORTFOLIO_OPS_PROD",
+                "object_type": "TABLE"
+              }
+            }
+          },
+          "ISSUER_TICKER_CANONICAL": {
+            "aliases": ["ML_ASE.T_ASE_ISSUER_TICKER"],
+            "defaults": {
+              "environments": ["PREPOD", "DR"],
+              "fqdn": "RAW_DB.CORE.ISSUER_TICKER_PREPOD",
+              "object_type": "VIEW"
+            }
           }
         }
-      },
-      "ISSUER_TICKER_CANONICAL": {
-        "aliases": ["ML_ASE.T_ASE_ISSUER_TICKER"],
-        "defaults": {
-          "environments": ["PREPOD", "DR"],
-          "fqdn": "RAW_DB.CORE.ISSUER_TICKER_PREPOD",
-          "object_type": "VIEW"
-        }
-      }
-    }
-    with open(test_valid_json_path, 'w', encoding='utf-8') as f:
-        json.dump(valid_map_content, f, indent=2)
-    
-    try:
-        original_resolver_file = FilePaths.SOURCE_FQDN_RESOLVER_FILE
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = test_valid_json_path
-
-        test_map = load_fqdn_resolver()
-        print("Successfully loaded valid resolver map:")
-        for k, v in test_map.items():
-            print(f"  '{k}' -> '{v}'")
-        if test_map.get("PORTDB.PORTFOLIO_OPS_CANONICAL", {}).get("DEV") == {"fqdn": "RAW_DB.CORE.PORTFOLIO_OPS_COMMON", "object_type": "TABLE"} and \
-           test_map.get("PORTDB.PORTFOLIO_OPS_CANONICAL", {}).get("PROD") == {"fqdn": "PROD_RAW_DB.PROD_CORE.PORTFOLIO_OPS_PROD", "object_type": "TABLE"}:
-            print("  Specific environment lookups work as expected.")
-        else:
-            print("  WARNING: Specific environment lookups may not be working as expected.")
-    except Exception as e:
-        print(f"ERROR in Test Case 1 (Valid map): {e}")
-    finally:
-        if os.path.exists(test_valid_json_path):
-            os.remove(test_valid_json_path)
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = original_resolver_file
-
-
-    # Test Case 2: Duplicate canonical key (different case)
-    print("\n=== Test Case 2: Duplicate canonical key (different case) ===")
-    test_duplicate_case_json_path = "test_duplicate_case_fqdn_resolver.json"
-    duplicate_case_content = {
-      "CANONICAL_A": {
-        "defaults": {"environments": ["DEV"], "fqdn": "DB.A.TABLE", "object_type": "TABLE"}
-      },
-      "canonical_a": { # Duplicate key, different case
-        "defaults": {"environments": ["PROD"], "fqdn": "DB.B.TABLE", "object_type": "TABLE"}
-      }
-    }
-    with open(test_duplicate_case_json_path, 'w', encoding='utf-8') as f:
-        json.dump(duplicate_case_content, f, indent=2)
-    
-    try:
-        original_resolver_file = FilePaths.SOURCE_FQDN_RESOLVER_FILE
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = test_duplicate_case_json_path
-        load_fqdn_resolver()
-        print("ERROR: Duplicate canonical key (different case) was NOT detected.")
-    except ValueError as e:
-        print(f"SUCCESS: Caught expected error for duplicate canonical key (different case): {e}")
-    except Exception as e:
-        print(f"ERROR in Test Case 2 (Duplicate case): Unexpected error: {e}")
-    finally:
-        if os.path.exists(test_duplicate_case_json_path):
-            os.remove(test_duplicate_case_json_path)
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = original_resolver_file
-
-
-    # Test Case 3: Alias conflict (same alias points to different canonicals/FQDNs)
-    print("\n=== Test Case 3: Alias conflict ===")
-    test_duplicate_alias_json_path = "test_duplicate_alias_fqdn_resolver.json"
-    duplicate_alias_content = {
-      "CANONICAL_X": {
-        "defaults": {"environments": ["DEV"], "fqdn": "DB.X.TABLE", "object_type": "TABLE"},
-        "aliases": ["COMMON_ALIAS"]
-      },
-      "CANONICAL_Y": {
-        "defaults": {"environments": ["DEV"], "fqdn": "DB.Y.TABLE", "object_type": "TABLE"}, # Different FQDN
-        "aliases": ["COMMON_ALIAS"] # Same alias, different FQDN
-      }
-    }
-    with open(test_duplicate_alias_json_path, 'w', encoding='utf-8') as f:
-        json.dump(duplicate_alias_content, f, indent=2)
-    
-    try:
-        original_resolver_file = FilePaths.SOURCE_FQDN_RESOLVER_FILE
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = test_duplicate_alias_json_path
-        load_fqdn_resolver()
-        print("ERROR: Alias conflict was NOT detected.")
-    except ValueError as e:
-        print(f"SUCCESS: Caught expected error for alias conflict: {e}")
-    except Exception as e:
-        print(f"ERROR in Test Case 3 (Alias conflict): Unexpected error: {e}")
-    finally:
-        if os.path.exists(test_duplicate_alias_json_path):
-            os.remove(test_duplicate_alias_json_path)
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = original_resolver_file
-
-
-    # Test Case 4: Missing 'fqdn' key in default entry
-    print("\n=== Test Case 4: Missing 'fqdn' in 'defaults' ===")
-    test_missing_fqdn_default_json_path = "test_missing_fqdn_default_resolver.json"
-    missing_fqdn_default_content = {
-      "CANONICAL_Z": {
-        "defaults": {"environments": ["DEV"]}, # Missing 'fqdn' key
-        "aliases": []
-      }
-    }
-    with open(test_missing_fqdn_default_json_path, 'w', encoding='utf-8') as f:
-        json.dump(missing_fqdn_default_content, f, indent=2)
-    
-    try:
-        original_resolver_file = FilePaths.SOURCE_FQDN_RESOLVER_FILE
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = test_missing_fqdn_default_json_path
-        load_fqdn_resolver()
-        print("ERROR: Missing 'fqdn' in 'defaults' was NOT detected.")
-    except ValueError as e:
-        print(f"SUCCESS: Caught expected error for missing 'fqdn' in 'defaults': {e}")
-    except Exception as e:
-        print(f"ERROR in Test Case 4 (Missing 'fqdn' default): Unexpected error: {e}")
-    finally:
-        if os.path.exists(test_missing_fqdn_default_json_path):
-            os.remove(test_missing_fqdn_default_json_path)
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = original_resolver_file
-
-
-    # Test Case 5: Malformed FQDN format
-    print("\n=== Test Case 5: Malformed FQDN format ===")
-    test_malformed_fqdn_json_path = "test_malformed_fqdn_resolver.json"
-    malformed_fqdn_content = {
-      "CANONICAL_M": {
-        "defaults": {"environments": ["DEV"], "fqdn": "DB.SCHEMA_ONLY", "object_type": "TABLE"}, # Malformed FQDN
-        "aliases": []
-      }
-    }
-    with open(test_malformed_fqdn_json_path, 'w', encoding='utf-8') as f:
-        json.dump(malformed_fqdn_content, f, indent=2)
-    
-    try:
-        original_resolver_file = FilePaths.SOURCE_FQDN_RESOLVER_FILE
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = test_malformed_fqdn_json_path
-        load_fqdn_resolver()
-        print("ERROR: Malformed FQDN was NOT detected.")
-    except ValueError as e:
-        print(f"SUCCESS: Caught expected error for malformed FQDN: {e}")
-    except Exception as e:
-        print(f"ERROR in Test Case 5 (Malformed FQDN): Unexpected error: {e}")
-    finally:
-        if os.path.exists(test_malformed_fqdn_json_path):
-            os.remove(test_malformed_fqdn_json_path)
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = original_resolver_file
-
-
-    # Test Case 6: Missing 'environments' key in defaults
-    print("\n=== Test Case 6: Missing 'environments' in 'defaults' ===")
-    test_missing_envs_json_path = "test_missing_envs_resolver.json"
-    missing_envs_content = {
-      "CANONICAL_E": {
-        "defaults": {"fqdn": "DB.E.TABLE", "object_type": "TABLE"}, # Missing 'environments'
-        "aliases": []
-      }
-    }
-    with open(test_missing_envs_json_path, 'w', encoding='utf-8') as f:
-        json.dump(missing_envs_content, f, indent=2)
-    
-    try:
-        original_resolver_file = FilePaths.SOURCE_FQDN_RESOLVER_FILE
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = test_missing_envs_json_path
-        load_fqdn_resolver()
-        print("ERROR: Missing 'environments' in 'defaults' was NOT detected.")
-    except ValueError as e:
-        print(f"SUCCESS: Caught expected error for missing 'environments' in 'defaults': {e}")
-    except Exception as e:
-        print(f"ERROR in Test Case 6 (Missing environments): Unexpected error: {e}")
-    finally:
-        if os.path.exists(test_missing_envs_json_path):
-            os.remove(test_missing_envs_json_path)
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = original_resolver_file
-        
-    # Test Case 7: Canonical key with no environment mapping at all
-    print("\n=== Test Case 7: Canonical key with no environment mapping ===")
-    test_no_env_map_json_path = "test_no_env_map_resolver.json"
-    no_env_map_content = {
-      "CANONICAL_N": {
-        "aliases": ["ALIAS_N"]
-        # No 'defaults' or 'specific_environments'
-      }
-    }
-    with open(test_no_env_map_json_path, 'w', encoding='utf-8') as f:
-        json.dump(no_env_map_content, f, indent=2)
-    
-    try:
-        original_resolver_file = FilePaths.SOURCE_FQDN_RESOLVER_FILE
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = test_no_env_map_json_path
-        load_fqdn_resolver()
-        print("ERROR: No environment mapping for canonical key was NOT detected.")
-    except ValueError as e:
-        print(f"SUCCESS: Caught expected error for no environment mapping: {e}")
-    except Exception as e:
-        print(f"ERROR in Test Case 7 (No env mapping): Unexpected error: {e}")
-    finally:
-        if os.path.exists(test_no_env_map_json_path):
-            os.remove(test_no_env_map_json_path)
-        FilePaths.SOURCE_FQDN_RESOLVER_FILE = original_resolver_file
+        test_valid_json_path = os.path.join(test_dir, "test_valid_fqdn_resolver.json")
+        with open(test_valid_json_path, 'w', encoding='utf-8') as f:
+            json.dump(valid_map_content, f, indent=2)
+
+        try:
+            test_map = load_fqdn_resolver(test_valid_json_path)
+            print("Successfully loaded valid resolver map:")
+            for k, v in test_map.items():
+                # Nested levels are read-only proxies; print them as plain dicts
+                print(f"  '{k}' -> '{ {env: dict(details) for env, details in v.items()} }'")
+            if test_map.get("PORTDB.PORTFOLIO_OPS_CANONICAL", {}).get("DEV") == {"fqdn": "RAW_DB.CORE.PORTFOLIO_OPS_COMMON", "object_type": "TABLE"} and \
+               test_map.get("PORTDB.PORTFOLIO_OPS_CANONICAL", {}).get("PROD") == {"fqdn": "PROD_RAW_DB.PROD_CORE.PORTFOLIO_OPS_PROD", "object_type": "TABLE"}:
+                print("  Specific environment lookups work as expected.")
+            else:
+                print("  WARNING: Specific environment lookups may not be working as expected.")
+        except Exception as e:
+            print(f"ERROR in Test Case 1 (Valid map): {e}")
+
+        # Test Cases 2-7: each malformed map must be rejected with a ValueError.
+        # (case number, title, file stem, expected-error description, payload)
+        invalid_cases = [
+            (2, "Duplicate canonical key (different case)", "test_duplicate_case_fqdn_resolver",
+             "duplicate canonical key (different case)", {
+              "CANONICAL_A": {
+                "defaults": {"environments": ["DEV"], "fqdn": "DB.A.TABLE", "object_type": "TABLE"}
+              },
+              "canonical_a": { # Duplicate key, different case
+                "defaults": {"environments": ["PROD"], "fqdn": "DB.B.TABLE", "object_type": "TABLE"}
+              }
+            }),
+            (3, "Alias conflict", "test_duplicate_alias_fqdn_resolver",
+             "alias conflict", {
+              "CANONICAL_X": {
+                "defaults": {"environments": ["DEV"], "fqdn": "DB.X.TABLE", "object_type": "TABLE"},
+                "aliases": ["COMMON_ALIAS"]
+              },
+              "CANONICAL_Y": {
+                "defaults": {"environments": ["DEV"], "fqdn": "DB.Y.TABLE", "object_type": "TABLE"}, # Different FQDN
+                "aliases": ["COMMON_ALIAS"] # Same alias, different FQDN
+              }
+            }),
+            (4, "Missing 'fqdn' in 'defaults'", "test_missing_fqdn_default_resolver",
+             "missing 'fqdn' in 'defaults'", {
+              "CANONICAL_Z": {
+                "defaults": {"environments": ["DEV"]}, # Missing 'fqdn' key
+                "aliases": []
+              }
+            }),
+            (5, "Malformed FQDN format", "test_malformed_fqdn_resolver",
+             "malformed FQDN", {
+              "CANONICAL_M": {
+                "defaults": {"environments": ["DEV"], "fqdn": "DB.SCHEMA_ONLY", "object_type": "TABLE"}, # Malformed FQDN
+                "aliases": []
+              }
+            }),
+            (6, "Missing 'environments' in 'defaults'", "test_missing_envs_resolver",
+             "missing 'environments' in 'defaults'", {
+              "CANONICAL_E": {
+                "defaults": {"fqdn": "DB.E.TABLE", "object_type": "TABLE"}, # Missing 'environments'
+                "aliases": []
+              }
+            }),
+            (7, "Canonical key with no environment mapping", "test_no_env_map_resolver",
+             "no environment mapping", {
+              "CANONICAL_N": {
+                "aliases": ["ALIAS_N"]
+                # No 'defaults' or 'specific_environments'
+              }
+            }),
+        ]
+
+        for case_number, case_title, file_stem, expected_error, payload in invalid_cases:
+            print(f"\n=== Test Case {case_number}: {case_title} ===")
+            test_json_path = os.path.join(test_dir, f"{file_stem}.json")
+            with open(test_json_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, indent=2)
+
+            try:
+                load_fqdn_resolver(test_json_path)
+                print(f"ERROR: {case_title} was NOT detected.")
+            except ValueError as e:
+                print(f"SUCCESS: Caught expected error for {expected_error}: {e}")
+            except Exception as e:
+                print(f"ERROR in Test Case {case_number} ({case_title}): Unexpected error: {e}")
 
     print("\n--- Testing load_fqdn_resolver function complete ---")
-    
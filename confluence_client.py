@@ -1,73 +1,93 @@
 # confluence_client.py
 import requests
-from bs4 import BeautifulSoup
 from config import ConfluenceConfig, get_confluence_page_title
+from confluence_utils import (
+    clean_special_characters_iterative, clean_text_from_html_basic, extract_page_metadata_values,
+    create_confluence_session, HTTP_TIMEOUT, BOOLEAN_COLUMN_KEYS, METADATA_CANDIDATE_TAGS, PAGE_CONTENT_STRAINER,
+    YES_CELL_VALUES, get_table_rows, parse_confluence_html, sanitize_table_name_for_file, standardize_header_key
+)
 import os
 import json
-from urllib.parse import quote
+import tempfile
 import re 
-from collections import deque
 import itertools # NEW: For generating title permutations
+from types import MappingProxyType
 
-# Your provided iterative cleaning function
-def clean_special_characters_iterative(data):
+# NEW: orjson is optional; it decodes large page bodies faster than the stdlib-backed response.json()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _decode_json_response(response):
     """
-    Iteratively cleans special characters from strings in a nested structure.
-    Handles dicts and lists without recursion.
+    Decodes a JSON API response, using orjson when it is installed.
     """
-    if isinstance(data, (str, int, float, bool, type(None))):
-        return data
-    
-    queue = deque([data])
-
-    while queue:
-        current = queue.popleft()
-
-        if isinstance(current, dict):
-            for key, value in list(current.items()):
-                if isinstance(value, (dict, list)):
-                    queue.append(value)
-                elif isinstance(value, str):
-                    try:
-                        decoded = value.encode('unicode_escape').decode('latin-1')
-                    except UnicodeEncodeError:
-                        decoded = value
-                    
-                    cleaned = re.sub(r'[^\\x00-\\x7F]+', ' ', decoded) 
-                    current[key] = re.sub(r'\s+', ' ', cleaned).strip()
-        
-        elif isinstance(current, list):
-            for i in range(len(current)):
-                item = current[i]
-                if isinstance(item, (dict, list)):
-                    queue.append(item)
-                elif isinstance(item, str):
-                    try:
-                        decoded = item.encode('unicode_escape').decode('latin-1')
-                    except UnicodeEncodeError:
-                        decoded = item
-                    cleaned = re.sub(r'[^\\x00-\\x7F]+', ' ', decoded)
-                    current[i] = re.sub(r'\s+', ' ', cleaned).strip()
-    return data
-
-# Basic HTML text cleaner (still useful for initial extraction from BS4)
-def clean_text_from_html_basic(element):
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# NEW: Output files are replaced in one step, so a crash mid-write never leaves truncated JSON behind
+def _write_file_atomically(path, data):
     """
-    Extracts text from a BeautifulSoup element, replaces non-breaking spaces
-    with regular spaces, and strips whitespace.
+    Writes `data` (bytes) to a uniquely named temp file in the same directory as `path`,
+    fsyncs it, then renames it over `path`. Concurrent writers never share a temp file, and
+    a crash leaves either the old file or the complete new one.
     """
-    if element is None:
-        return ""
-    
-    text = element.get_text(separator=" ", strip=True) 
-    text = text.replace(u'\xa0', u' ')
-    text = text.replace('&nbsp;', ' ')
-    return text.strip()
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or '.', prefix=f".{name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file as 0600; keep the permissions a plain open() would give
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# NEW: Format version of the parsed-page cache files. Bump it whenever _parse_page_html output
+# changes, so entries written by an older parser are ignored (and pruned) instead of served.
+PAGE_CACHE_FORMAT_VERSION = 2
+# Cache file names after the "<space>_<page_id>_" prefix: "<version>.json" (pre-format-version
+# entries) or "<version>_v<format>.json"
+PAGE_CACHE_NAME_SUFFIX_RE = re.compile(r'\d+(?:_v\d+)?\.json')
+
+
+# Expected headers of the *first* (primary definitions) table and their standardized keys.
+# Built once at import; read-only so the shared mapping can't be altered by a parse.
+ALL_EXPECTED_PRIMARY_TABLE_HEADERS_MAP = MappingProxyType({
+    'Source table': 'source_table',
+    'Source field name': 'source_field_name', 
+    'Add Source To Target?': 'add_to_target', 
+    'Target Field name': 'target_field_name',
+    'Data type': 'data_type',
+    'Decode': 'decode',
+    'ADC Transformation': 'adc_transformation',
+    'Deprecated': 'deprecated',
+    'Primary Key': 'is_primary_key', 
+    'Definition': 'definition',
+    'proto file': 'proto_file',
+    'proto column name': 'proto_column_name',
+    'Comments': 'comments'
+})
 
 
 class ConfluencePageParser:
     # NEW: Max retries for fuzzy title matching
     MAX_TITLE_SEARCH_RETRIES = 5 # You can adjust this number
+    # NEW: Directory for parsed-page cache files (one JSON file per page version)
+    PAGE_CACHE_DIR = os.path.join(".cache", "confluence")
+    # NEW: A few CQL hits per title search, so an exact match isn't hidden behind a looser one
+    CQL_SEARCH_LIMIT = 5
 
     def __init__(self):
         self.base_url = ConfluenceConfig.BASE_URL
@@ -82,13 +102,23 @@ class ConfluencePageParser:
                 "and CONFLUENCE_SPACE_KEY are set in your environment variables or .env file."
             )
 
+        # NEW: One pooled session for all API calls, so keep-alive connections (and the TLS
+        # handshake) are reused across title lookups instead of reconnecting per request
+        self._session = create_confluence_session(self.api_token)
+
+    # NEW: Release the pooled connections; the parser can also be used as a context manager
+    def close(self):
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     # MODIFIED: _get_page_id_by_title now includes retry logic
     def _get_page_id_by_title(self, title):
-        search_url = f"{self.base_url}/rest/api/content"
-        headers = {
-            "Accept": "application/json",
-            "Authorization": f"Bearer {self.api_token}"
-        }
+        search_url = f"{self.base_url}/rest/api/content/search" # MODIFIED: CQL search endpoint
         
         # Generator for title variations
         def generate_title_variations(original_title):
@@ -144,25 +174,26 @@ class ConfluencePageParser:
                 continue # Skip if already tried
             tried_titles.add(current_title_variant)
 
-            encoded_title = quote(current_title_variant, safe='') 
-            
+            # MODIFIED: Exact title + space filter as CQL; json.dumps quotes and escapes the values as CQL expects
+            cql = (f"type = page AND space = {json.dumps(self.space_key)} "
+                   f"AND title = {json.dumps(current_title_variant, ensure_ascii=False)}")
             params = {
-                "title": encoded_title, 
-                "spaceKey": self.space_key,
-                "expand": "body.storage",
-                "limit": 1
+                "cql": cql,
+                "expand": "version", # MODIFIED: body is fetched separately, only when not cached
+                "limit": self.CQL_SEARCH_LIMIT
             }
 
             print(f"Attempt {attempt_num + 1}/{self.MAX_TITLE_SEARCH_RETRIES}: Searching for page '{current_title_variant}' in space '{self.space_key}'...")
             try:
-                response = requests.get(search_url, headers=headers, params=params)
+                response = self._session.get(search_url, params=params, timeout=HTTP_TIMEOUT)
                 response.raise_for_status() # This will raise HTTPError for 4xx/5xx responses
                 
-                data = response.json()
-                if data and data["results"]:
-                    page = data["results"][0]
+                data = _decode_json_response(response)
+                # CQL title matching is looser than ==, so only accept the exact variant
+                page = next((p for p in (data or {}).get("results", []) if p.get("title") == current_title_variant), None)
+                if page is not None:
                     print(f"SUCCESS: Found page '{page.get('title', 'N/A')}' with ID: {page['id']} (attempt {attempt_num + 1}).") 
-                    return page['id'], page['body']['storage']['value']
+                    return page['id'], page.get('version', {}).get('number')
             except requests.exceptions.HTTPError as e:
                 # 404 Not Found, 401 Unauthorized, etc.
                 if e.response.status_code == 404:
@@ -177,16 +208,95 @@ class ConfluencePageParser:
               f"Please ensure the page title in config.py is exact, the space key is correct, and permissions allow access.")
         return None, None
 
+    # NEW: Fetch the storage-format body for a page already resolved by title
+    def _get_page_content_html(self, page_id):
+        content_url = f"{self.base_url}/rest/api/content/{page_id}"
+        response = self._session.get(content_url, params={"expand": "body.storage"}, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        return _decode_json_response(response)['body']['storage']['value']
+
+    # NEW: On-disk cache of parsed pages, keyed by space, page ID and page version
+    def _get_page_cache_path(self, page_id, page_version):
+        if page_version is None:
+            return None # Without a version number there is no safe cache key
+        return os.path.join(self.PAGE_CACHE_DIR,
+                            f"{self.space_key}_{page_id}_{page_version}_v{PAGE_CACHE_FORMAT_VERSION}.json")
+
+    def _read_page_cache(self, cache_path):
+        try:
+            if orjson is not None:
+                with open(cache_path, 'rb') as f:
+                    return orjson.loads(f.read())
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"WARNING: Could not read page cache '{cache_path}': {e}. Re-parsing page.")
+            return None
+
+    def _write_page_cache(self, page_id, cache_path, structured_page_data):
+        try:
+            os.makedirs(self.PAGE_CACHE_DIR, exist_ok=True)
+            if orjson is not None:
+                cache_bytes = orjson.dumps(structured_page_data)
+            else:
+                cache_bytes = json.dumps(structured_page_data, ensure_ascii=False).encode('utf-8')
+            _write_file_atomically(cache_path, cache_bytes)
+        except OSError as e:
+            print(f"WARNING: Could not write page cache '{cache_path}': {e}")
+            return
+        self._prune_page_cache(page_id, cache_path)
+
+    # NEW: Drop cache files left behind by older page versions or older cache formats of the same page
+    def _prune_page_cache(self, page_id, current_cache_path):
+        current_name = os.path.basename(current_cache_path)
+        stale_prefix = f"{self.space_key}_{page_id}_"
+        try:
+            cache_names = os.listdir(self.PAGE_CACHE_DIR)
+        except OSError:
+            return
+        for name in cache_names:
+            if name == current_name or not name.startswith(stale_prefix):
+                continue
+            if not PAGE_CACHE_NAME_SUFFIX_RE.fullmatch(name, len(stale_prefix)):
+                continue # Another page whose ID merely shares this prefix, or not a cache file
+            try:
+                os.remove(os.path.join(self.PAGE_CACHE_DIR, name))
+            except OSError as e:
+                print(f"WARNING: Could not remove stale page cache '{name}': {e}")
+
     # ... (rest of your ConfluencePageParser class and functions, including get_structured_data_from_page)
 
+    # MODIFIED: Resolves the page version first and reuses the cached parse when that version was seen before
     def get_structured_data_from_page(self):
-        page_id, page_content_html = self._get_page_id_by_title(self.page_title)
+        page_id, page_version = self._get_page_id_by_title(self.page_title)
+
+        if not page_id:
+            print("Could not retrieve page content. Exiting.")
+            return None
+
+        cache_path = self._get_page_cache_path(page_id, page_version)
+        if cache_path:
+            cached_page_data = self._read_page_cache(cache_path)
+            if cached_page_data is not None:
+                print(f"Using cached parse of page {page_id} (version {page_version}): {cache_path}")
+                return cached_page_data
 
-        if not page_id or not page_content_html:
+        page_content_html = self._get_page_content_html(page_id)
+        if not page_content_html:
             print("Could not retrieve page content. Exiting.")
             return None
 
-        soup = BeautifulSoup(page_content_html, 'html.parser')
+        structured_page_data = self._parse_page_html(page_id, page_content_html)
+        if cache_path:
+            self._write_page_cache(page_id, cache_path, structured_page_data)
+        return structured_page_data
+
+    def _parse_page_html(self, page_id, page_content_html):
+        # NEW: Prefer the C-backed lxml tree builder; fall back to the stdlib parser if lxml isn't installed
+        # MODIFIED: Strained to the metadata blocks and tables, the only parts of the page read below
+        soup = parse_confluence_html(page_content_html, parse_only=PAGE_CONTENT_STRAINER)
         
         structured_page_data = {
             "page_title": self.page_title, # This will be cleaned by the iterative cleaner later
@@ -196,51 +306,30 @@ class ConfluencePageParser:
         }
 
         # --- Extract Page-Level Metadata ---
-        def extract_text_metadata(soup_obj, label):
-            # Using basic cleaner here, as deep cleaner will run on entire structure
-            tag = soup_obj.find(lambda t: t.name in ['p', 'div', 'h1', 'h2', 'h3'] and label in clean_text_from_html_basic(t))
-            if tag:
-                clean_full_text = clean_text_from_html_basic(tag)
-                parts = clean_full_text.split(label, 1)
-                if len(parts) > 1:
-                    value = parts[1].strip()
-                    if label == "Database name:" and "Historization: SCD-2" in value:
-                        value = value.replace("Historization: SCD-2", "").strip()
-                    return value
-            return None
+        # Single pass over the candidate blocks: each block's text is cleaned once and checked
+        # against every label not yet found (first block in document order wins per label).
+        # One tree walk collects both the metadata candidate blocks and the tables (document order)
+        metadata_candidates, all_html_tables = [], []
+        for tag in soup.find_all(METADATA_CANDIDATE_TAGS + ['table']):
+            (all_html_tables if tag.name == 'table' else metadata_candidates).append(tag)
+
+        # Using basic cleaner here, as deep cleaner will run on entire structure
+        metadata_values = extract_page_metadata_values(metadata_candidates)
 
-        structured_page_data["metadata"]["table_name"] = extract_text_metadata(soup, "Table name:")
-        structured_page_data["metadata"]["schema_name"] = extract_text_metadata(soup, "Schema name:")
-        structured_page_data["metadata"]["database_name"] = extract_text_metadata(soup, "Database name:")
+        structured_page_data["metadata"]["table_name"] = metadata_values.get("Table name:")
+        structured_page_data["metadata"]["schema_name"] = metadata_values.get("Schema name:")
+        structured_page_data["metadata"]["database_name"] = metadata_values.get("Database name:")
 
-        pk_text = extract_text_metadata(soup, "Primary Keys:")
+        pk_text = metadata_values.get("Primary Keys:")
         structured_page_data["metadata"]["primary_keys"] = [k.strip() for k in pk_text.split(',') if k.strip()] if pk_text else []
 
-        fk_text = extract_text_metadata(soup, "Foreign Keys:")
+        fk_text = metadata_values.get("Foreign Keys:")
         structured_page_data["metadata"]["foreign_keys"] = [k.strip() for k in fk_text.split(',') if k.strip()] if fk_text else []
 
         if not structured_page_data["metadata"].get("table_name"):
              structured_page_data["metadata"]["table_name"] = self.page_title.replace("Table: ", "").strip()
-        
-        # Define ALL expected headers and their standardized keys for the *first* table structure
-        all_expected_primary_table_headers_map = {
-            'Source table': 'source_table',
-            'Source field name': 'source_field_name', 
-            'Add Source To Target?': 'add_to_target', 
-            'Target Field name': 'target_field_name',
-            'Data type': 'data_type',
-            'Decode': 'decode',
-            'ADC Transformation': 'adc_transformation',
-            'Deprecated': 'deprecated',
-            'Primary Key': 'is_primary_key', 
-            'Definition': 'definition',
-            'proto file': 'proto_file',
-            'proto column name': 'proto_column_name',
-            'Comments': 'comments'
-        }
 
         # --- Extract Table Data (Iterate through all tables) ---
-        all_html_tables = soup.find_all('table')
         if not all_html_tables:
             print("No tables found on the Confluence page.")
             return structured_page_data
@@ -252,73 +341,89 @@ class ConfluencePageParser:
                 "columns": []
             }
             
-            rows = html_table.find_all('tr')
+            rows = get_table_rows(html_table) # Own rows only; nested tables are parsed on their own
             if not rows:
                 print(f"Table {table_id} has no rows. Skipping.")
                 continue
 
-            header_cells = rows[0].find_all(['th', 'td'])
+            # Direct children only, like the data rows: a table nested in a header cell adds no headers
+            header_cells = rows[0].find_all(['th', 'td'], recursive=False)
             actual_headers_raw_cleaned = [clean_text_from_html_basic(cell) for cell in header_cells]
 
             current_table_headers_mapping_strategy = {}
+            header_indices = {}
             table_type = ""
 
+            # MODIFIED: One pass per table type fills both the mapping strategy and header_indices
             if i == 0: # First table: Use the predefined map
                 table_type = "primary_definitions"
-                current_table_headers_mapping_strategy = {
-                    h_orig: h_std for h_orig, h_std in all_expected_primary_table_headers_map.items()
-                }
                 print(f"Parsing table {table_id} with predefined structure (primary_definitions).")
+                # Position of each header text, built once; setdefault keeps the first occurrence,
+                # matching list.index() for repeated header names
+                header_positions = {}
+                for col_idx, h_raw_cleaned in enumerate(actual_headers_raw_cleaned):
+                    header_positions.setdefault(h_raw_cleaned, col_idx)
+                for original_header, standardized_key in ALL_EXPECTED_PRIMARY_TABLE_HEADERS_MAP.items():
+                    current_table_headers_mapping_strategy[original_header] = standardized_key
+                    header_indices[standardized_key] = header_positions.get(original_header, -1)
             else: # Subsequent tables: Dynamically generate map
                 table_type = "dynamic_auxiliary"
                 print(f"Parsing table {table_id} with dynamic structure (dynamic_auxiliary).")
-                for h_raw_cleaned in actual_headers_raw_cleaned:
-                    h_cleaned_for_map = h_raw_cleaned.replace(' ', '_').replace('?', '').replace('-', '_').lower()
-                    current_table_headers_mapping_strategy[h_raw_cleaned] = h_cleaned_for_map 
+                for col_idx, h_raw_cleaned in enumerate(actual_headers_raw_cleaned):
+                    h_standardized_key = standardize_header_key(h_raw_cleaned)
+                    current_table_headers_mapping_strategy[h_raw_cleaned] = h_standardized_key
+                    header_indices[h_standardized_key] = col_idx
 
             parsed_table_data["table_type"] = table_type
 
-            header_indices = {}
-            if i == 0:
-                for original_header, standardized_key in all_expected_primary_table_headers_map.items():
-                    try:
-                        header_indices[standardized_key] = actual_headers_raw_cleaned.index(original_header)
-                    except ValueError:
-                        header_indices[standardized_key] = -1
-            else:
-                for col_idx, h_raw_cleaned in enumerate(actual_headers_raw_cleaned):
-                    h_standardized_key = h_raw_cleaned.replace(' ', '_').replace('?', '').replace('-', '_').lower()
-                    header_indices[h_standardized_key] = col_idx
+            # Primary rows are only kept when they carry a source or target field name; without
+            # either header no row can qualify, so the (empty) table is recorded without a row scan
+            if i == 0 and header_indices['source_field_name'] == -1 and header_indices['target_field_name'] == -1:
+                print(f"Table {table_id} has no 'Source field name' or 'Target Field name' header. Skipping its rows.")
+                structured_page_data["tables"].append(parsed_table_data)
+                continue
 
+            # NEW: Column plan built once per table. Every key starts from its default (False for
+            # yes/no columns, "" otherwise) in mapping order; only the keys whose header is present
+            # are then read from the row, by position.
+            column_defaults = {}
+            column_plan = []
+            for standardized_key in current_table_headers_mapping_strategy.values():
+                if standardized_key in column_defaults:
+                    continue
+                is_bool = standardized_key in BOOLEAN_COLUMN_KEYS
+                column_defaults[standardized_key] = False if is_bool else ""
+                idx = header_indices.get(standardized_key, -1)
+                if idx != -1:
+                    column_plan.append((standardized_key, idx, is_bool))
+            column_plan = tuple(column_plan)
 
             for row in rows[1:]:
-                cols = row.find_all('td')
+                # Direct children only: cells of a table nested inside a cell are not columns of this row
+                cols = row.find_all('td', recursive=False)
                 if not cols:
                     continue
                 
-                column_data = {}
-                keys_to_process = list(current_table_headers_mapping_strategy.values())
-                
-                for standardized_key in keys_to_process:
-                    idx = header_indices.get(standardized_key, -1) 
-                    if idx != -1 and idx < len(cols):
-                        value = clean_text_from_html_basic(cols[idx])
-                        
-                        if standardized_key in ['add_to_target', 'is_primary_key', 'deprecated']:
-                            column_data[standardized_key] = (value.lower() == 'yes')
-                        else:
-                            column_data[standardized_key] = value
-                    else:
-                        if standardized_key in ['add_to_target', 'is_primary_key', 'deprecated']:
-                            column_data[standardized_key] = False
-                        else:
-                            column_data[standardized_key] = ""
+                # Clean only the cells the plan reads (each once); unmapped cells are never cleaned
+                num_cols = len(cols)
+                planned_values = [
+                    (standardized_key, clean_text_from_html_basic(cols[idx]), is_bool)
+                    for standardized_key, idx, is_bool in column_plan if idx < num_cols
+                ]
+                # Auxiliary rows with no text in any planned cell can't pass the filter below; skip
+                # them before the row dict is built
+                if i != 0 and not any(value for _, value, _ in planned_values):
+                    continue
+
+                column_data = column_defaults.copy()
+                for standardized_key, value, is_bool in planned_values:
+                    column_data[standardized_key] = (value in YES_CELL_VALUES) if is_bool else value
                 
                 if i == 0:
                     if column_data.get('source_field_name') or column_data.get('target_field_name'):
                         parsed_table_data["columns"].append(column_data)
                 else:
-                    if any(v for k, v in column_data.items() if v not in ["", False, None]):
+                    if any(column_data.values()): # Values are only str/bool, so "" and False are the falsy ones
                          parsed_table_data["columns"].append(column_data)
 
             structured_page_data["tables"].append(parsed_table_data)
@@ -337,13 +442,16 @@ def save_structured_data_to_single_file(structured_data, output_dir="tables"):
     os.makedirs(output_dir, exist_ok=True)
 
     table_name_raw = structured_data["metadata"].get("table_name", "untitled_table")
-    table_name_for_file = table_name_raw.lower().replace(" ", "_")
-    table_name_for_file = re.sub(r'[^a-z0-9_.-]', '', table_name_for_file)
+    table_name_for_file = sanitize_table_name_for_file(table_name_raw)
     
     filename = os.path.join(output_dir, f"{table_name_for_file}.json")
-    with open(filename, 'w', encoding='utf-8') as f:
-        cleaned_structured_data = clean_special_characters_iterative(structured_data)
-        json.dump(cleaned_structured_data, f, indent=2, ensure_ascii=False)
+    cleaned_structured_data = clean_special_characters_iterative(structured_data)
+    # NEW: orjson (when installed) encodes the indented file in C; stdlib json otherwise
+    if orjson is not None:
+        file_bytes = orjson.dumps(cleaned_structured_data, option=orjson.OPT_INDENT_2)
+    else:
+        file_bytes = json.dumps(cleaned_structured_data, indent=2, ensure_ascii=False).encode('utf-8')
+    _write_file_atomically(filename, file_bytes)
     print(f"Saved full page data to: {filename}")
 
 
@@ -361,8 +469,13 @@ if __name__ == "__main__":
 
         if structured_data:
             print("\n--- Successfully Extracted Structured Data ---")
-            display_data = clean_special_characters_iterative(json.loads(json.dumps(structured_data))) 
-            print(json.dumps(display_data, indent=2))
+            # NEW: orjson (when installed) for the deep copy and the indented dump of the demo output
+            if orjson is not None:
+                display_data = clean_special_characters_iterative(orjson.loads(orjson.dumps(structured_data)))
+                print(orjson.dumps(display_data, option=orjson.OPT_INDENT_2).decode())
+            else:
+                display_data = clean_special_characters_iterative(json.loads(json.dumps(structured_data))) 
+                print(json.dumps(display_data, indent=2))
 
             save_structured_data_to_single_file(structured_data)
 
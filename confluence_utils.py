@@ -1,8 +1,12 @@
 # confluence_utils.py (Full code for this file)
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, FeatureNotFound, NavigableString, SoupStrainer
 from urllib.parse import quote
 import re 
+import html
+import random
 from collections import deque
 from datetime import datetime
 import json # For handling labels as JSON string
@@ -58,12 +62,188 @@ def clean_text_from_html_basic(element):
     if element is None:
         return ""
     
-    text = element.get_text(separator=" ", strip=True) 
+    # NEW: Fast path for the common single-text cell: .string is that one string (even through
+    # single-child wrappers), and stripping it equals get_text(strip=True) without the descendant walk.
+    # Comments/CDATA are not plain NavigableStrings, so they still go through get_text.
+    single_string = element.string
+    if type(single_string) is NavigableString:
+        text = single_string.strip()
+    else:
+        text = element.get_text(separator=" ", strip=True) 
     text = text.replace(u'\xa0', u' ')
     text = text.replace('&nbsp;', ' ')
     return text.strip()
 
 
+# NEW: Table-name -> filename sanitizing, built once at import: spaces become underscores in one
+# translate() pass, then anything outside [a-z0-9_.-] is dropped by a precompiled pattern
+FILENAME_SPACE_TRANSLATION = str.maketrans(" ", "_")
+FILENAME_UNSAFE_CHARS_RE = re.compile(r'[^a-z0-9_.-]')
+
+
+def sanitize_table_name_for_file(table_name):
+    """
+    Lowercases a table name, replaces spaces with underscores and strips every
+    character not allowed in output filenames.
+    """
+    return FILENAME_UNSAFE_CHARS_RE.sub('', table_name.lower().translate(FILENAME_SPACE_TRANSLATION))
+
+
+# NEW: Header text -> standardized column key in one translate() pass
+# (same result as .replace(' ', '_').replace('?', '').replace('-', '_') followed by .lower())
+HEADER_KEY_TRANSLATION = str.maketrans({' ': '_', '?': None, '-': '_'})
+
+
+def standardize_header_key(header_text):
+    """
+    Converts cleaned header text to its standardized key: spaces and hyphens become
+    underscores, question marks are dropped, and the result is lowercased.
+    """
+    return header_text.translate(HEADER_KEY_TRANSLATION).lower()
+
+
+# NEW: Row-group wrappers whose <tr> children still belong to the table itself
+TABLE_ROW_GROUP_TAGS = ('thead', 'tbody', 'tfoot')
+
+
+def get_table_rows(html_table):
+    """
+    Returns the table's own <tr> rows in document order: direct children and rows of
+    its direct thead/tbody/tfoot. Rows of tables nested inside its cells are excluded.
+    """
+    rows = []
+    for child in html_table.find_all(['tr', *TABLE_ROW_GROUP_TAGS], recursive=False):
+        if child.name == 'tr':
+            rows.append(child)
+        else:
+            rows.extend(child.find_all('tr', recursive=False))
+    return rows
+
+
+# NEW: Storage-format macros (links, code blocks, ...) carry their text in CDATA sections
+CDATA_SECTION_RE = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.S)
+
+
+def escape_cdata_sections(page_content_html):
+    """
+    Replaces each <![CDATA[...]]> section with its escaped text. The lxml HTML
+    parser drops CDATA sections entirely, while html.parser keeps their text.
+    """
+    if '<![CDATA[' not in page_content_html:
+        return page_content_html
+    return CDATA_SECTION_RE.sub(lambda m: html.escape(m.group(1), quote=False), page_content_html)
+
+
+# NEW: Shared soup builder for page content HTML
+def parse_confluence_html(page_content_html, parse_only=None):
+    """
+    Builds a BeautifulSoup tree with the C-backed lxml parser, falling back
+    to Python's html.parser when lxml isn't installed. `parse_only` is passed
+    through as a SoupStrainer to keep only the parts of the page that are used.
+    CDATA sections are turned into escaped text first so lxml keeps their text.
+    """
+    try:
+        return BeautifulSoup(escape_cdata_sections(page_content_html), 'lxml', parse_only=parse_only)
+    except FeatureNotFound:
+        return BeautifulSoup(page_content_html, 'html.parser', parse_only=parse_only)
+
+
+# NEW: Page-level metadata labels looked for in the content HTML
+METADATA_LABELS = ("Table name:", "Schema name:", "Database name:", "Primary Keys:", "Foreign Keys:")
+# NEW: Historization marker that shares a line with "Database name:" and is dropped from its value
+SCD2_MARKER = "Historization: SCD-2"
+# NEW: Block-level tags whose text may carry a metadata label
+METADATA_CANDIDATE_TAGS = ['p', 'div', 'h1', 'h2', 'h3']
+# NEW: Only metadata blocks and tables (each with its full subtree) are kept when building the page
+# tree; everything else outside them is never turned into soup objects
+PAGE_CONTENT_STRAINER = SoupStrainer(METADATA_CANDIDATE_TAGS + ['table'])
+
+
+def extract_metadata_label_value(clean_full_text, label):
+    """
+    Returns the text after `label` in an already-cleaned block text (label must be present).
+    """
+    value = clean_full_text.split(label, 1)[1].strip()
+    if label == "Database name:" and SCD2_MARKER in value:
+        value = value.replace(SCD2_MARKER, "").strip()
+    return value
+
+
+def extract_page_metadata_values(candidate_tags):
+    """
+    Single pass over the candidate blocks (document order): each block's text is cleaned once
+    and checked against every label not yet found, so the first block carrying a label wins.
+    Returns {label: value} for the labels found; stops as soon as all of them are found.
+    """
+    metadata_values = {}
+    for tag in candidate_tags:
+        clean_full_text = clean_text_from_html_basic(tag)
+        for label in METADATA_LABELS:
+            if label not in metadata_values and label in clean_full_text:
+                metadata_values[label] = extract_metadata_label_value(clean_full_text, label)
+        if len(metadata_values) == len(METADATA_LABELS):
+            break
+    return metadata_values
+
+
+# NEW: Standardized column keys whose cell values are parsed as yes/no booleans
+BOOLEAN_COLUMN_KEYS = frozenset({'add_to_target', 'is_primary_key', 'deprecated'})
+# Every casing of "yes" (same result as value.lower() == 'yes', without the temporary string)
+YES_CELL_VALUES = frozenset({'yes', 'Yes', 'yEs', 'yeS', 'YEs', 'YeS', 'yES', 'YES'})
+
+# NEW: Max titles OR-ed into a single CQL search by find_pages_by_exact_titles
+CQL_TITLE_BATCH_SIZE = 50
+
+# NEW: Connection pool size for Confluence HTTP sessions (>= the number of concurrent lookups)
+HTTP_POOL_SIZE = 32
+# NEW: (connect, read) timeout in seconds for every Confluence API call, so a stalled socket can't hang a stage
+HTTP_TIMEOUT = (5, 30)
+# NEW: Transient statuses retried (with backoff) by the session's adapter before the caller sees them
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+HTTP_MAX_RETRIES = 5
+HTTP_RETRY_BACKOFF = 0.5
+# NEW: Upper bound (seconds) on a single backoff sleep; a server Retry-After header is honoured as sent
+HTTP_RETRY_BACKOFF_MAX = 30
+
+
+# NEW: Full-jitter exponential backoff, so concurrent lookups hitting a 429 don't retry in lockstep
+class JitteredRetry(Retry):
+    """
+    urllib3 Retry whose backoff sleep is drawn uniformly from [0, capped exponential backoff].
+    """
+    def get_backoff_time(self):
+        backoff = min(HTTP_RETRY_BACKOFF_MAX, super().get_backoff_time())
+        return random.uniform(0, backoff) if backoff > 0 else 0
+
+
+# NEW: Shared factory for the pooled, authenticated session used for all Confluence API calls
+def create_confluence_session(api_token, pool_size=HTTP_POOL_SIZE):
+    """
+    Returns a requests.Session carrying the Confluence auth/accept headers, with a pooled
+    HTTPAdapter mounted so keep-alive connections are reused across API calls.
+    Transient failures are retried by the adapter (jittered backoff, Retry-After honoured); once retries run out the last
+    response is returned as-is so callers' raise_for_status() handling still applies.
+    """
+    session = requests.Session()
+    session.headers.update({
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate", # Explicit: page bodies compress well
+        "Authorization": f"Bearer {api_token}"
+    })
+    retries = JitteredRetry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        allowed_methods=frozenset(['GET']), # Every Confluence call here is a read
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class ConfluencePageParser:
     MAX_TITLE_SEARCH_RETRIES = 5
     # Define common expand parameters for detailed metadata (NO body.storage here)
@@ -80,12 +260,25 @@ class ConfluencePageParser:
                 "Please ensure base_url, api_token, and space_key are provided."
             )
 
-    def find_page_by_title(self, title): 
+        # NEW: One pooled session (auth + accept headers) reused by every API call on this parser
+        self._session = create_confluence_session(self.api_token)
+
+    # NEW: Release the pooled connections; the parser can also be used as a context manager
+    def close(self):
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def find_page_by_title(self, title, log=print): 
+        """
+        Searches for `title` and its spacing/colon variations. Progress lines go to `log`
+        (print by default), so concurrent callers can collect each lookup's lines.
+        """
         search_url = f"{self.base_url}/rest/api/content"
-        headers = {
-            "Accept": "application/json",
-            "Authorization": f"Bearer {self.api_token}"
-        }
         
         def generate_title_variations(original_title):
             yield original_title
@@ -136,16 +329,16 @@ class ConfluencePageParser:
                 "limit": 1
             }
 
-            print(f"Attempt {attempts_made}/{self.MAX_TITLE_SEARCH_RETRIES}: Searching for page '{current_title_variant}'...")
+            log(f"Attempt {attempts_made}/{self.MAX_TITLE_SEARCH_RETRIES}: Searching for page '{current_title_variant}'...")
             try:
-                response = requests.get(search_url, headers=headers, params=params)
+                response = self._session.get(search_url, params=params, timeout=HTTP_TIMEOUT)
                 response.raise_for_status()
                 
                 data = response.json()
                 if data and data["results"]:
                     page = data["results"][0]
                     found_title = page.get('title', current_title_variant)
-                    print(f"SUCCESS: Found page '{found_title}' with ID: {page['id']} (attempt {attempts_made}).") 
+                    log(f"SUCCESS: Found page '{found_title}' with ID: {page['id']} (attempt {attempts_made}).") 
                     return {
                         "status": "HIT",
                         "found_title": found_title,
@@ -155,12 +348,12 @@ class ConfluencePageParser:
                     }
             except requests.exceptions.HTTPError as e:
                 if e.response.status_code == 404:
-                    print(f"INFO: Page '{current_title_variant}' not found (HTTP 404). Trying next variation.")
+                    log(f"INFO: Page '{current_title_variant}' not found (HTTP 404). Trying next variation.")
                 else:
-                    print(f"WARNING: HTTP error {e.response.status_code} for title '{current_title_variant}'. "
+                    log(f"WARNING: HTTP error {e.response.status_code} for title '{current_title_variant}'. "
                           f"Content: {e.response.text.strip()} Trying next variation.")
             except Exception as e:
-                print(f"ERROR: An unexpected error occurred during API call for '{current_title_variant}': {e}. Trying next variation.")
+                log(f"ERROR: An unexpected error occurred during API call for '{current_title_variant}': {e}. Trying next variation.")
 
         return {
             "status": "MISS", 
@@ -170,22 +363,81 @@ class ConfluencePageParser:
             "attempts_made": attempts_made
         }
 
+    # NEW: Resolve many exact titles with a few CQL searches instead of one request per title
+    def find_pages_by_exact_titles(self, titles, batch_size=CQL_TITLE_BATCH_SIZE):
+        """
+        Looks up pages whose title matches one of `titles` exactly, batching the titles into
+        CQL 'title = ... OR ...' searches. Returns {title: {"page_id": ..., "found_title": ...}}
+        for the titles found; titles missing from the result still need find_page_by_title.
+        A failed batch is reported and skipped, so its titles simply fall back as well.
+        """
+        search_url = f"{self.base_url}/rest/api/content/search"
+
+        unique_titles = list(dict.fromkeys(titles))
+        wanted_titles = set(unique_titles)
+        found_pages = {}
+
+        for batch_start in range(0, len(unique_titles), batch_size):
+            batch = unique_titles[batch_start:batch_start + batch_size]
+            # json.dumps gives a double-quoted string with '"' and '\' escaped, as CQL expects
+            title_clauses = " OR ".join(f"title = {json.dumps(t, ensure_ascii=False)}" for t in batch)
+            cql = f"space = {json.dumps(self.space_key)} AND type = page AND ({title_clauses})"
+
+            start = 0
+            print(f"Batch title lookup: {len(batch)} titles via CQL search...")
+            try:
+                while True:
+                    params = {"cql": cql, "start": start, "limit": batch_size}
+                    response = self._session.get(search_url, params=params, timeout=HTTP_TIMEOUT)
+                    response.raise_for_status()
+                    data = response.json()
+
+                    results = data.get("results", [])
+                    for page in results:
+                        # CQL title matching is looser than ==, so only accept exact matches
+                        page_title = page.get("title")
+                        if page_title in wanted_titles and page_title not in found_pages:
+                            found_pages[page_title] = {"page_id": page["id"], "found_title": page_title}
+
+                    if not results or "next" not in data.get("_links", {}):
+                        break
+                    start += len(results)
+            except requests.exceptions.HTTPError as e:
+                print(f"WARNING: HTTP error {e.response.status_code} during batch title lookup. "
+                      f"These titles will be searched individually.")
+            except Exception as e:
+                print(f"WARNING: Batch title lookup failed: {e}. These titles will be searched individually.")
+
+        return found_pages
+
+    # NEW: Fetch the storage-format body for a page on the pooled session
+    def get_page_content_html(self, page_id):
+        """
+        Fetches body.storage for a given page ID and returns its HTML value (None if the page has no body).
+        """
+        content_url = f"{self.base_url}/rest/api/content/{page_id}"
+        params = {
+            "expand": "body.storage"
+        }
+
+        response = self._session.get(content_url, params=params, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+
+        data_with_body = response.json()
+        return data_with_body.get('body', {}).get('storage', {}).get('value')
+
     # NEW: Method to fetch ONLY expanded page metadata (no body.storage)
     def get_expanded_page_metadata(self, page_id):
         """
         Fetches ONLY expanded metadata for a given page ID.
         """
         content_url = f"{self.base_url}/rest/api/content/{page_id}"
-        headers = {
-            "Accept": "application/json",
-            "Authorization": f"Bearer {self.api_token}"
-        }
         params = {
             "expand": self.EXPAND_METADATA_PARAMS
         }
 
         print(f"Fetching expanded metadata for page ID: {page_id}...")
-        response = requests.get(content_url, headers=headers, params=params)
+        response = self._session.get(content_url, params=params, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
         
         data = response.json()
@@ -227,28 +479,14 @@ class ConfluencePageParser:
         return metadata
 
 
-    # This method remains unchanged for now, will be used in Stage 3
-    def get_structured_data_from_html(self, page_id, page_title_for_struct, page_content_html):
-        """
-        Parses the Confluence page content HTML into a structured dictionary of tables and columns.
-        This function expects raw HTML content and does not make API calls.
-        """
-        soup = BeautifulSoup(page_content_html, 'html.parser')
-        
-        structured_page_data = {
-            "page_title": page_title_for_struct,
-            "page_id": page_id,
-            "metadata": {}, 
-            "tables": []
-        }
-
     # MODIFIED: get_structured_data_from_html for full dynamic parsing
     def get_structured_data_from_html(self, page_id, page_title_for_struct, page_content_html):
         """
         Parses the Confluence page content HTML into a structured dictionary of tables and columns.
         This function now dynamically parses all tables found on the page based on their headers.
         """
-        soup = BeautifulSoup(page_content_html, 'html.parser')
+        # MODIFIED: lxml when available, strained to the metadata blocks and tables read below
+        soup = parse_confluence_html(page_content_html, parse_only=PAGE_CONTENT_STRAINER)
         
         structured_page_data = {
             "page_title": page_title_for_struct,
@@ -259,26 +497,20 @@ class ConfluencePageParser:
 
         # --- Extract Page-Level (table-specific) Metadata from content HTML ---
         # This part still extracts specific labels IF they exist in the HTML content
-        def extract_text_metadata(soup_obj, label):
-            tag = soup_obj.find(lambda t: t.name in ['p', 'div', 'h1', 'h2', 'h3'] and label in clean_text_from_html_basic(t))
-            if tag:
-                clean_full_text = clean_text_from_html_basic(tag)
-                parts = clean_full_text.split(label, 1)
-                if len(parts) > 1:
-                    value = parts[1].strip()
-                    if label == "Database name:" and "Historization: SCD-2" in value:
-                        value = value.replace("Historization: SCD-2", "").strip()
-                    return value
-            return None
-
-        structured_page_data["metadata"]["table_name"] = extract_text_metadata(soup, "Table name:")
-        structured_page_data["metadata"]["schema_name"] = extract_text_metadata(soup, "Schema name:")
-        structured_page_data["metadata"]["database_name"] = extract_text_metadata(soup, "Database name:")
-
-        pk_text = extract_text_metadata(soup, "Primary Keys:")
+        # MODIFIED: One tree walk collects both the metadata candidate blocks and the tables (document order)
+        metadata_candidates, all_html_tables = [], []
+        for tag in soup.find_all(METADATA_CANDIDATE_TAGS + ['table']):
+            (all_html_tables if tag.name == 'table' else metadata_candidates).append(tag)
+
+        metadata_values = extract_page_metadata_values(metadata_candidates)
+        structured_page_data["metadata"]["table_name"] = metadata_values.get("Table name:")
+        structured_page_data["metadata"]["schema_name"] = metadata_values.get("Schema name:")
+        structured_page_data["metadata"]["database_name"] = metadata_values.get("Database name:")
+
+        pk_text = metadata_values.get("Primary Keys:")
         structured_page_data["metadata"]["primary_keys"] = [k.strip() for k in pk_text.split(',') if k.strip()] if pk_text else []
 
-        fk_text = extract_text_metadata(soup, "Foreign Keys:")
+        fk_text = metadata_values.get("Foreign Keys:")
         structured_page_data["metadata"]["foreign_keys"] = [k.strip() for k in fk_text.split(',') if k.strip()] if fk_text else []
 
         # Fallback if no table_name found in content
@@ -289,7 +521,6 @@ class ConfluencePageParser:
         # all_expected_primary_table_headers_map is removed.
 
         # --- Extract Table Data (Iterate through all tables, ALL dynamically) ---
-        all_html_tables = soup.find_all('table')
         if not all_html_tables:
             print("No tables found on the Confluence page content.")
             return structured_page_data
@@ -302,57 +533,100 @@ class ConfluencePageParser:
                 "columns": []
             }
             
-            rows = html_table.find_all('tr')
+            rows = get_table_rows(html_table) # Own rows only; nested tables are parsed on their own
             if not rows:
                 print(f"Table {table_id} has no rows. Skipping.")
                 continue
 
-            header_cells = rows[0].find_all(['th', 'td'])
+            # Direct children only, like the data rows: a table nested in a header cell adds no headers
+            header_cells = rows[0].find_all(['th', 'td'], recursive=False)
             actual_headers_raw_cleaned = [clean_text_from_html_basic(cell) for cell in header_cells]
 
             # --- NEW: Dynamic Header Mapping Strategy for ALL tables ---
             # Maps raw (but cleaned) header text to standardized (cleaned, lower, underscored) keys
+            # MODIFIED: header_indices (standardized key -> column index) is filled in the same pass
             current_table_headers_mapping = {}
-            for h_raw_cleaned in actual_headers_raw_cleaned:
-                h_standardized_key = h_raw_cleaned.replace(' ', '_').replace('?', '').replace('-', '_').lower()
-                current_table_headers_mapping[h_raw_cleaned] = h_standardized_key 
-            
-            # Build header_indices: map standardized key to its column index
             header_indices = {}
             for col_idx, h_raw_cleaned in enumerate(actual_headers_raw_cleaned):
-                h_standardized_key = current_table_headers_mapping[h_raw_cleaned]
+                h_standardized_key = standardize_header_key(h_raw_cleaned)
+                current_table_headers_mapping[h_raw_cleaned] = h_standardized_key
                 header_indices[h_standardized_key] = col_idx
 
+            # Column plan, built once per table: (standardized_key, column_index, is_boolean).
+            # Rows start from the per-table defaults (False for boolean keys, "" otherwise),
+            # so missing cells need no per-row branch.
+            column_plan = tuple(
+                (standardized_key, header_indices[standardized_key], standardized_key in BOOLEAN_COLUMN_KEYS)
+                for standardized_key in current_table_headers_mapping.values()
+            )
+            column_defaults = {
+                standardized_key: (False if is_boolean else "")
+                for standardized_key, _, is_boolean in column_plan
+            }
+            plan_keys = tuple(standardized_key for standardized_key, _, _ in column_plan)
+            min_cols_for_full_row = max((idx for _, idx, _ in column_plan), default=-1) + 1
 
             for row in rows[1:]: # Skip header row
-                cols = row.find_all('td')
+                # Direct children only: cells of a table nested inside a cell are not columns of this row
+                cols = row.find_all('td', recursive=False)
                 if not cols:
                     continue
                 
-                column_data = {}
-                keys_to_process = list(current_table_headers_mapping.values()) # Standardized keys
-                
-                for standardized_key in keys_to_process:
-                    idx = header_indices.get(standardized_key, -1) 
-                    if idx != -1 and idx < len(cols):
+                num_cols = len(cols)
+                if num_cols >= min_cols_for_full_row:
+                    # Every planned column is present: build the row in one dict(zip(...))
+                    row_values = []
+                    for _, idx, is_boolean in column_plan:
                         value = clean_text_from_html_basic(cols[idx])
-                        
                         # Apply boolean conversion for specific known keywords, if they exist
-                        if standardized_key in ['add_to_target', 'is_primary_key', 'deprecated']:
-                            column_data[standardized_key] = (value.lower() == 'yes')
-                        else:
-                            column_data[standardized_key] = value
-                    else:
-                        # Assign default values for missing columns based on type
-                        if standardized_key in ['add_to_target', 'is_primary_key', 'deprecated']:
-                            column_data[standardized_key] = False
-                        else:
-                            column_data[standardized_key] = ""
+                        row_values.append((value in YES_CELL_VALUES) if is_boolean else value)
+                    # Blank row (only "" / False values): skip it before building its dict
+                    if not any(row_values):
+                        continue
+                    column_data = dict(zip(plan_keys, row_values))
+                else:
+                    # Short row: start from the defaults and fill only the cells that exist
+                    column_data = column_defaults.copy()
+                    for standardized_key, idx, is_boolean in column_plan:
+                        if idx < num_cols:
+                            value = clean_text_from_html_basic(cols[idx])
+                            column_data[standardized_key] = (value in YES_CELL_VALUES) if is_boolean else value
                 
                 # Append if it has any meaningful data (not all empty strings/falses)
-                if any(v for k, v in column_data.items() if v not in ["", False, None]):
+                if any(column_data.values()): # Values are only str/bool, so "" and False are the falsy ones
                      parsed_table_data["columns"].append(column_data)
 
             structured_page_data["tables"].append(parsed_table_data)
             
         return structured_page_data
+
+
+if __name__ == "__main__":
+    print("--- Comparing lxml and html.parser on storage-format macros ---")
+
+    # Cell text inside ac:/ri: macros lives in CDATA sections; both parsers must keep it
+    macro_page_html = (
+        "<p>Table name: MACRO_TABLE</p>"
+        "<table><tbody>"
+        "<tr><th>Column Name</th><th>Description</th></tr>"
+        "<tr><td>LINKED</td><td>See <ac:link><ri:page ri:content-title=\"Other\" />"
+        "<ac:plain-text-link-body><![CDATA[Other table]]></ac:plain-text-link-body></ac:link></td></tr>"
+        "<tr><td>CODE</td><td><ac:structured-macro ac:name=\"code\">"
+        "<ac:plain-text-body><![CDATA[select 1 < 2 & 3]]></ac:plain-text-body></ac:structured-macro></td></tr>"
+        "</tbody></table>"
+    )
+
+    def cell_texts(soup):
+        return [[clean_text_from_html_basic(cell) for cell in row.find_all(['th', 'td'])]
+                for row in soup.find_all('tr')]
+
+    lxml_rows = cell_texts(parse_confluence_html(macro_page_html, parse_only=PAGE_CONTENT_STRAINER))
+    html_parser_rows = cell_texts(BeautifulSoup(macro_page_html, 'html.parser', parse_only=PAGE_CONTENT_STRAINER))
+    for row in lxml_rows:
+        print(row)
+    if lxml_rows == html_parser_rows:
+        print("PASS: lxml output matches html.parser.")
+    else:
+        print("FAIL: lxml output differs from html.parser:")
+        for row in html_parser_rows:
+            print(row)
@@ -3,12 +3,16 @@ import os
 import json
 from datetime import datetime
 import hashlib
-import re # For filename sanitization
+from concurrent.futures import ThreadPoolExecutor
+import requests # For requests.exceptions.HTTPError raised by the parser's API calls
 
 from config import ConfluenceConfig, FilePaths
-from confluence_utils import ConfluencePageParser, clean_special_characters_iterative
+from confluence_utils import ConfluencePageParser, clean_special_characters_iterative, sanitize_table_name_for_file
 from database_manager import DatabaseManager
 
+# NEW: Page bodies fetched and parsed concurrently; DB writes stay serial on the calling thread
+CONTENT_FETCH_MAX_WORKERS = 8
+
 
 def parse_and_store_confluence_content():
     """
@@ -33,6 +37,7 @@ def parse_and_store_confluence_content():
 
     if not pages_from_db:
         print("No approved pages found in the database for content parsing.")
+        confluence_parser.close()
         db_manager.disconnect()
         return
 
@@ -53,104 +58,119 @@ def parse_and_store_confluence_content():
 
     if not pages_to_parse:
         print("No approved pages with updated metadata or pending parsing found in the database.")
+        confluence_parser.close()
         db_manager.disconnect()
         return
 
     print(f"Found {len(pages_to_parse)} approved pages requiring content parsing.")
 
+    # Mark every page as in flight before the fetches start; DB writes stay on this thread
     for page_entry in pages_to_parse:
-        page_id = page_entry.get("page_id")
-        api_title = page_entry.get("api_title") or page_entry.get("found_title")
-        current_metadata_hash = page_entry.get("hash_id")
-
-        print(f"\nProcessing content for page: '{api_title}' (ID: {page_id})...")
-        
         page_entry["extraction_status"] = "PENDING_PARSE"
         db_manager.insert_or_update_page_metadata(clean_special_characters_iterative(page_entry))
 
-        try:
-            content_url = f"{confluence_parser.base_url}/rest/api/content/{page_id}"
-            headers = {
-                "Accept": "application/json",
-                "Authorization": f"Bearer {confluence_parser.api_token}"
-            }
-            params = {
-                "expand": "body.storage"
-            }
-
-            print(f"  Fetching body.storage content for page ID: {page_id}...")
-            response = requests.get(content_url, headers=headers, params=params)
-            response.raise_for_status()
-            
-            data_with_body = response.json()
-            content_html = data_with_body.get('body', {}).get('storage', {}).get('value')
-
-            if not content_html:
-                raise ValueError("No body.storage content found for parsing.")
-
-            # Stage 3.2: Parse structured table data from content_html
-            structured_data_from_html = confluence_parser.get_structured_data_from_html(
-                page_id=page_id,
-                page_title_for_struct=api_title,
-                page_content_html=content_html
-            )
-            
-            # FIX: Check if structured_data_from_html is valid before proceeding
-            if structured_data_from_html is None:
-                raise ValueError("HTML parser returned None, likely no tables found on page.")
-
-            # Apply deep cleaning to the structured HTML data
-            cleaned_structured_data = clean_special_characters_iterative(structured_data_from_html)
-
-            # Stage 3.3: Store structured data as JSON string in DB
-            parsed_json_str = json.dumps(cleaned_structured_data, ensure_ascii=False)
-            db_manager.insert_or_update_parsed_content(page_id, parsed_json_str)
-            
-            # Update metadata table with successful parsing status and hash
-            # FIX: Correctly access the table name from cleaned_structured_data
-            table_name_from_parsed_content = cleaned_structured_data.get("metadata", {}).get("table_name", api_title)
-            sanitized_table_name_for_ref = re.sub(r'[^a-z0-9_.-]', '', table_name_from_parsed_content.lower().replace(" ", "_"))
-
-            page_entry["structured_data_file"] = f"{sanitized_table_name_for_ref}.json"
-            page_entry["extraction_status"] = "PARSED_OK"
-            page_entry["last_parsed_content_hash"] = current_metadata_hash
-            print(f"  Structured content for '{api_title}' (ID: {page_id}) parsed and stored in DB.")
-            
-        except requests.exceptions.HTTPError as e:
-            page_entry["extraction_status"] = "API_FAILED_CONTENT"
-            page_entry["notes"] += f" | API error fetching content: {e.response.status_code} - {e.response.text.strip()}"
-            print(f"  ERROR: API error fetching content for {api_title} (ID: {page_id}): {e.response.status_code}")
-        except ValueError as e: # Catch ValueErrors from parsing failures or missing content
-            page_entry["extraction_status"] = "PARSE_FAILED"
-            page_entry["notes"] += f" | Content parsing/access error: {e}"
-            print(f"  ERROR: Content parsing/access error for {api_title} (ID: {page_id}): {e}")
-        except Exception as e:
-            page_entry["extraction_status"] = "PARSE_FAILED"
-            page_entry["notes"] += f" | Error during content parsing: {e}. Trace: {e.__traceback__.tb_frame.f_code.co_filename}:{e.__traceback__.tb_lineno}"
-            print(f"  ERROR: Unexpected parsing error for {api_title} (ID: {page_id}): {e}")
-        
-        # Always update metadata table with latest status and hash (including potential error states)
-        try:
-            cleaned_page_entry_for_db = clean_special_characters_iterative(page_entry)
-            db_manager.insert_or_update_page_metadata(cleaned_page_entry_for_db)
-            print(f"  Metadata table updated for '{api_title}' (ID: {page_id}).")
-        except Exception as e:
-            print(f"  CRITICAL ERROR: Could not update DB metadata after content parse for '{api_title}' (ID: {page_id}): {e}")
-            page_entry["notes"] += f" | CRITICAL DB STORE ERROR: {e}"
-            # Attempt to update it again with the error status (minimal fields to prevent new errors)
-            try:
-                db_manager.insert_or_update_page_metadata({
-                    "page_id": page_id,
-                    "extraction_status": "DB_FAILED",
-                    "notes": page_entry["notes"]
-                })
-            except Exception as e_inner:
-                print(f"  FINAL DB WRITE FAILED for {api_title} (ID: {page_id}) with error: {e_inner}")
+    print(f"Fetching and parsing body.storage content for {len(pages_to_parse)} pages ({CONTENT_FETCH_MAX_WORKERS} at a time)...")
+    with ThreadPoolExecutor(max_workers=CONTENT_FETCH_MAX_WORKERS) as executor:
+        submitted_pages = [
+            (page_entry,
+             executor.submit(_fetch_and_parse_page_content, confluence_parser,
+                             page_entry.get("page_id"), page_entry.get("api_title") or page_entry.get("found_title")))
+            for page_entry in pages_to_parse
+        ]
 
+        # Results are consumed in submission order, so the DB sees the same sequence of writes
+        for page_entry, future in submitted_pages:
+            _store_parsed_page_result(db_manager, page_entry, future)
 
+    confluence_parser.close() # NEW: Release the pooled Confluence connections
     db_manager.disconnect()
     print("\n--- Confluence Content Parsing and Storage Complete ---")
 
 
+def _fetch_and_parse_page_content(confluence_parser, page_id, api_title):
+    """
+    Fetches body.storage for one page and returns its cleaned structured data.
+    Runs on a worker thread: no DB access here. Raises on API or parsing errors.
+    """
+    # MODIFIED: Fetched on the parser's pooled session (keep-alive, retries, timeout)
+    content_html = confluence_parser.get_page_content_html(page_id)
+
+    if not content_html:
+        raise ValueError("No body.storage content found for parsing.")
+
+    # Stage 3.2: Parse structured table data from content_html
+    structured_data_from_html = confluence_parser.get_structured_data_from_html(
+        page_id=page_id,
+        page_title_for_struct=api_title,
+        page_content_html=content_html
+    )
+    
+    # FIX: Check if structured_data_from_html is valid before proceeding
+    if structured_data_from_html is None:
+        raise ValueError("HTML parser returned None, likely no tables found on page.")
+
+    # Apply deep cleaning to the structured HTML data
+    return clean_special_characters_iterative(structured_data_from_html)
+
+
+def _store_parsed_page_result(db_manager, page_entry, future):
+    """
+    Stores one page's parse result (or its failure status) in the DB, on the calling thread.
+    """
+    page_id = page_entry.get("page_id")
+    api_title = page_entry.get("api_title") or page_entry.get("found_title")
+    current_metadata_hash = page_entry.get("hash_id")
+
+    print(f"\nProcessing content for page: '{api_title}' (ID: {page_id})...")
+
+    try:
+        cleaned_structured_data = future.result()
+
+        # Stage 3.3: Store structured data as JSON string in DB
+        parsed_json_str = json.dumps(cleaned_structured_data, ensure_ascii=False)
+        db_manager.insert_or_update_parsed_content(page_id, parsed_json_str)
+        
+        # Update metadata table with successful parsing status and hash
+        # FIX: Correctly access the table name from cleaned_structured_data
+        table_name_from_parsed_content = cleaned_structured_data.get("metadata", {}).get("table_name", api_title)
+        sanitized_table_name_for_ref = sanitize_table_name_for_file(table_name_from_parsed_content)
+
+        page_entry["structured_data_file"] = f"{sanitized_table_name_for_ref}.json"
+        page_entry["extraction_status"] = "PARSED_OK"
+        page_entry["last_parsed_content_hash"] = current_metadata_hash
+        print(f"  Structured content for '{api_title}' (ID: {page_id}) parsed and stored in DB.")
+        
+    except requests.exceptions.HTTPError as e:
+        page_entry["extraction_status"] = "API_FAILED_CONTENT"
+        page_entry["notes"] += f" | API error fetching content: {e.response.status_code} - {e.response.text.strip()}"
+        print(f"  ERROR: API error fetching content for {api_title} (ID: {page_id}): {e.response.status_code}")
+    except ValueError as e: # Catch ValueErrors from parsing failures or missing content
+        page_entry["extraction_status"] = "PARSE_FAILED"
+        page_entry["notes"] += f" | Content parsing/access error: {e}"
+        print(f"  ERROR: Content parsing/access error for {api_title} (ID: {page_id}): {e}")
+    except Exception as e:
+        page_entry["extraction_status"] = "PARSE_FAILED"
+        page_entry["notes"] += f" | Error during content parsing: {e}. Trace: {e.__traceback__.tb_frame.f_code.co_filename}:{e.__traceback__.tb_lineno}"
+        print(f"  ERROR: Unexpected parsing error for {api_title} (ID: {page_id}): {e}")
+    
+    # Always update metadata table with latest status and hash (including potential error states)
+    try:
+        cleaned_page_entry_for_db = clean_special_characters_iterative(page_entry)
+        db_manager.insert_or_update_page_metadata(cleaned_page_entry_for_db)
+        print(f"  Metadata table updated for '{api_title}' (ID: {page_id}).")
+    except Exception as e:
+        print(f"  CRITICAL ERROR: Could not update DB metadata after content parse for '{api_title}' (ID: {page_id}): {e}")
+        page_entry["notes"] += f" | CRITICAL DB STORE ERROR: {e}"
+        # Attempt to update it again with the error status (minimal fields to prevent new errors)
+        try:
+            db_manager.insert_or_update_page_metadata({
+                "page_id": page_id,
+                "extraction_status": "DB_FAILED",
+                "notes": page_entry["notes"]
+            })
+        except Exception as e_inner:
+            print(f"  FINAL DB WRITE FAILED for {api_title} (ID: {page_id}) with error: {e_inner}")
+
+
 if __name__ == "__main__":
     parse_and_store_confluence_content()
@@ -3,6 +3,7 @@ import os
 import json
 from datetime import datetime
 import hashlib # NEW: For hash_id calculation
+import requests # For requests.exceptions.HTTPError raised by the parser's API calls
 
 from config import ConfluenceConfig, FilePaths, get_confluence_page_titles
 from confluence_utils import ConfluencePageParser, clean_special_characters_iterative
@@ -175,6 +176,7 @@ def ingest_confluence_metadata():
                 pass
 
 
+    confluence_parser.close() # NEW: Release the pooled Confluence connections
     db_manager.disconnect()
     print("\n--- Confluence Metadata Ingestion Complete ---")
 
@@ -23,7 +23,9 @@ def check_and_ingest_ml_source_tables():
         db_manager.disconnect()
         return
 
-    unique_source_names_from_content = set()
+    # Raw (stripped) names are collected first so each distinct spelling is upper-cased once,
+    # rather than once per column row; resolver keys are already stored upper-cased.
+    raw_source_names_from_content = set()
     try:
         cursor = db_manager.conn.cursor()
         cursor.execute("SELECT parsed_json FROM confluence_parsed_content")
@@ -38,9 +40,8 @@ def check_and_ingest_ml_source_tables():
                     if table_data.get('id') == 'table_1':
                         for column in table_data.get('columns', []):
                             source_table_raw = column.get('source_table')
-                            if source_table_raw and source_table_raw.strip():
-                                source_table_cleaned_upper = source_table_raw.strip().upper()
-                                unique_source_names_from_content.add(source_table_cleaned_upper)
+                            if source_table_raw:
+                                raw_source_names_from_content.add(source_table_raw.strip())
     except json.JSONDecodeError as e:
         print(f"ERROR: Invalid JSON in confluence_parsed_content for a page: {e}")
         db_manager.disconnect()
@@ -50,6 +51,9 @@ def check_and_ingest_ml_source_tables():
         db_manager.disconnect()
         return
 
+    raw_source_names_from_content.discard("")
+    unique_source_names_from_content = {name.upper() for name in raw_source_names_from_content}
+
     # --- Resolve source names for each environment ---
     # resolved_fqdns_per_env: { canonical_source_name_upper: {env_name_upper: {"fqdn": FQDN, "object_type": TYPE}}}
     resolved_cross_env_fqdns_by_source = {} 
@@ -92,9 +96,10 @@ def check_and_ingest_ml_source_tables():
             continue
 
         non_existent_objects_in_this_env = []
+        env_name_upper = env_name.upper()
 
         for source_name_upper, env_details_map in resolved_cross_env_fqdns_by_source.items():
-            env_specific_details = env_details_map.get(env_name.upper())
+            env_specific_details = env_details_map.get(env_name_upper)
 
             if not env_specific_details:
                 print(f"  INFO: Logical source '{source_name_upper}' has no mapping for environment '{env_name}'. Skipping check for this env.")
@@ -114,7 +119,7 @@ def check_and_ingest_ml_source_tables():
             
             ml_db_entry = { 
                 "fqdn": fqdn_value,
-                "environment": env_name.upper(),
+                "environment": env_name_upper,
                 "object_type": object_type,
                 "db_name": db_name,
                 "schema_name": schema_name,
@@ -132,7 +137,7 @@ def check_and_ingest_ml_source_tables():
                     ml_db_entry["notes"] += f"Error during DDL check: {check_result['error']}"
 
                 if not check_result["exists"]:
-                    non_existent_objects_in_this_env.append(f"{fqdn_value} ({env_name.upper()}, {object_type})")
+                    non_existent_objects_in_this_env.append(f"{fqdn_value} ({env_name_upper}, {object_type})")
                     ml_db_entry["notes"] += f" | {object_type} does not exist in Snowflake."
                 
                 ml_db_entry["last_checked_on"] = datetime.now().isoformat()
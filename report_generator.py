@@ -2,9 +2,13 @@
 import os
 import json
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from config import ConfluenceConfig, FilePaths, get_confluence_page_titles
 from confluence_utils import ConfluencePageParser, clean_special_characters_iterative
 
+# NEW: Number of title lookups kept in flight against Confluence at once
+TITLE_CHECK_MAX_WORKERS = 8
+
 
 def generate_hit_or_miss_report():
     """
@@ -47,6 +51,9 @@ def generate_hit_or_miss_report():
         space_key=ConfluenceConfig.SPACE_KEY
     )
 
+    # Entries are appended in title order up front; the ones that still need a Confluence
+    # lookup are checked concurrently and updated in place, so the report order is unchanged.
+    pending_checks = []
     for title in titles_to_process:
         report_entry = existing_report_map.get(title, {
             "given_title": title,
@@ -66,33 +73,75 @@ def generate_hit_or_miss_report():
             report_entry["first_checked_on"] = current_timestamp
         report_entry["last_checked_on"] = current_timestamp
 
+        current_report_entries.append(report_entry)
+
         if report_entry["status"] == "HIT" and report_entry["user_verified"]:
             print(f"Skipping '{title}' as it was previously a HIT and user_verified.")
-            current_report_entries.append(report_entry)
             continue
-        
-        print(f"\n--- Checking page: '{title}' ---")
-        try:
-            search_result = parser.find_page_by_title(title)
-
-            report_entry["status"] = search_result["status"]
-            report_entry["found_title"] = search_result.get("found_title")
-            report_entry["page_id"] = search_result.get("page_id")
-            report_entry["notes"] = search_result.get("notes", "")
-            report_entry["attempts_made"] = search_result.get("attempts_made", 0)
-            
-            if search_result["status"] == "HIT":
-                print(f"Page '{search_result['found_title']}' found. Page ID: {search_result['page_id']}. Attempts: {report_entry['attempts_made']}.")
-            else:
-                print(f"Page '{title}' NOT found. Status: {search_result['status']}. Attempts: {report_entry['attempts_made']}.")
 
+        pending_checks.append((title, report_entry))
+
+    # Exact titles are resolved in a few batched CQL searches; only the rest need the
+    # per-title variation search below.
+    exact_title_hits = {}
+    if pending_checks:
+        try:
+            exact_title_hits = parser.find_pages_by_exact_titles([title for title, _ in pending_checks])
         except Exception as e:
-            report_entry["status"] = "ERROR"
-            report_entry["notes"] = f"Error during Confluence check: {e}"
-            report_entry["attempts_made"] = 0 
-            print(f"ERROR checking '{title}': {e}")
-        
-        current_report_entries.append(report_entry)
+            print(f"WARNING: Batch title lookup failed: {e}. Falling back to per-title search.")
+        print(f"Batch title lookup matched {len(exact_title_hits)} of {len(pending_checks)} titles exactly.")
+
+    # Workers collect their lookup's attempt logs instead of printing them, so each page's
+    # header, attempt logs and result are printed together when the result is consumed
+    def check_title(title):
+        attempt_log_lines = []
+        search_result = parser.find_page_by_title(title, log=attempt_log_lines.append)
+        return search_result, attempt_log_lines
+
+    print(f"\nChecking {len(pending_checks) - len(exact_title_hits)} page titles on Confluence ({TITLE_CHECK_MAX_WORKERS} at a time)...")
+    try:
+        with ThreadPoolExecutor(max_workers=TITLE_CHECK_MAX_WORKERS) as executor:
+            submitted_checks = [
+                (title, report_entry,
+                 None if title in exact_title_hits else executor.submit(check_title, title))
+                for title, report_entry in pending_checks
+            ]
+
+            for title, report_entry, future in submitted_checks:
+                print(f"\n--- Checking page: '{title}' ---")
+                try:
+                    if future is None:
+                        # Same shape find_page_by_title returns for a first-attempt match
+                        search_result = {
+                            "status": "HIT",
+                            "found_title": exact_title_hits[title]["found_title"],
+                            "page_id": exact_title_hits[title]["page_id"],
+                            "notes": f"Matched using variation: '{title}'",
+                            "attempts_made": 1
+                        }
+                    else:
+                        search_result, attempt_log_lines = future.result()
+                        for log_line in attempt_log_lines:
+                            print(log_line)
+
+                    report_entry["status"] = search_result["status"]
+                    report_entry["found_title"] = search_result.get("found_title")
+                    report_entry["page_id"] = search_result.get("page_id")
+                    report_entry["notes"] = search_result.get("notes", "")
+                    report_entry["attempts_made"] = search_result.get("attempts_made", 0)
+                    
+                    if search_result["status"] == "HIT":
+                        print(f"Page '{search_result['found_title']}' found for '{title}'. Page ID: {search_result['page_id']}. Attempts: {report_entry['attempts_made']}.")
+                    else:
+                        print(f"Page '{title}' NOT found. Status: {search_result['status']}. Attempts: {report_entry['attempts_made']}.")
+
+                except Exception as e:
+                    report_entry["status"] = "ERROR"
+                    report_entry["notes"] = f"Error during Confluence check: {e}"
+                    report_entry["attempts_made"] = 0 
+                    print(f"ERROR checking '{title}': {e}")
+    finally:
+        parser.close() # NEW: Release the pooled Confluence connections, even if the loop raises
 
     # Apply deep cleaning to the report itself to ensure all string fields are clean
     cleaned_report = clean_special_characters_iterative(current_report_entries)